@@ -10,12 +10,21 @@ WINDOW_MIN_SIZE = (1000, 650)
 MAX_VIDEOS = 50
 THUMBNAIL_SIZE = (88, 50)
 
+# バックグラウンド処理
+NETWORK_WORKERS = 4
+# サムネイルの取得・縮小を行うワーカー数
+THUMBNAIL_WORKERS = 4
+# 要約ストリーミング中の再描画間隔（秒）
+SUMMARY_STREAM_INTERVAL = 0.1
+
 # フォント設定
 FONT_SCALE_MIN = 50
 FONT_SCALE_MAX = 200
 FONT_SCALE_STEP = 10
 FONT_SCALE_DEFAULT = 100
 BASE_FONT_SIZE = 12
+# フォントサイズ変更を設定に保存するまでの待ち時間（ミリ秒）
+FONT_SCALE_SAVE_DELAY_MS = 500
 
 # カラーパレット - Refined Editorial Style
 COLORS = {
@@ -1,7 +1,59 @@
 """多言語対応（i18n）モジュール"""
+from functools import lru_cache
 from pathlib import Path
-import json
-from typing import Optional, Callable
+import re
+import threading
+from typing import Iterator, Optional, Callable
+
+from app import jsonio
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+# str.format_map で安全に扱える名前付きフィールド
+_FORMAT_FIELD_RE = re.compile(r"\{[A-Za-z_]\w*\}")
+
+
+class _SafeDict(dict):
+    """未指定のプレースホルダーをそのまま残す"""
+
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
+
+def _flatten(data: dict, prefix: str = "") -> Iterator[tuple[str, str]]:
+    """ネストした翻訳辞書を (ドット記法キー, 文字列) のペアに展開"""
+    for k, v in data.items():
+        path = f"{prefix}{k}"
+        if isinstance(v, dict):
+            yield from _flatten(v, f"{path}.")
+        elif isinstance(v, str):
+            yield path, v
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(template: str) -> Optional[tuple[str, ...]]:
+    """
+    プレースホルダー付き文字列を事前解析
+
+    Returns:
+        format_map でそのまま置換できる場合はNone、
+        それ以外は [リテラル, 名前, リテラル, ...] に分割したセグメント
+    """
+    rest = _FORMAT_FIELD_RE.sub("", template)
+    if "{" not in rest and "}" not in rest:
+        return None
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+def _format_template(template: str, kwargs: dict) -> str:
+    """プレースホルダーを1パスで置換（未指定のものは残す）"""
+    segments = _compile_template(template)
+    if segments is None:
+        return template.format_map(_SafeDict(kwargs))
+    parts = list(segments)
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        parts[i] = str(kwargs[name]) if name in kwargs else f"{{{name}}}"
+    return "".join(parts)
 
 
 class I18nManager:
@@ -29,19 +81,39 @@ class I18nManager:
         self.default_language = default_language
         self.current_language = default_language
         self._translations: dict[str, dict] = {}
+        self._flat: dict[str, dict[str, str]] = {}
+        self._available: set[str] = set()
+        self._load_lock = threading.Lock()
         self._observers: list[Callable] = []
+        # (言語, キー, 引数) -> 翻訳結果 のメモ化（未翻訳キーも含めてキャッシュ）
+        self._lookup = lru_cache(maxsize=4096)(self._lookup_uncached)
         self._load_translations()
 
     def _load_translations(self) -> None:
-        """全言語の翻訳をロード"""
-        for lang in self.SUPPORTED_LANGUAGES:
-            file_path = self.locales_dir / f"{lang}.json"
-            if file_path.exists():
+        """利用可能な翻訳ファイルを索引化（パースは初回使用時に遅延実行）"""
+        self._available = {
+            lang for lang in self.SUPPORTED_LANGUAGES
+            if (self.locales_dir / f"{lang}.json").exists()
+        }
+
+    def _ensure_loaded(self, lang: str) -> dict[str, str]:
+        """指定言語の翻訳を未ロードならロードし、フラット化した辞書を返す"""
+        flat = self._flat.get(lang)
+        if flat is not None:
+            return flat
+        if lang not in self._available:
+            return {}
+
+        with self._load_lock:
+            if lang not in self._flat:
+                file_path = self.locales_dir / f"{lang}.json"
                 try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        self._translations[lang] = json.load(f)
+                    self._translations[lang] = jsonio.read_json(file_path)
                 except Exception as e:
                     print(f"[WARN] Failed to load translation '{lang}': {e}")
+                    self._translations[lang] = {}
+                self._flat[lang] = dict(_flatten(self._translations[lang]))
+            return self._flat[lang]
 
     def set_language(self, language: str) -> bool:
         """
@@ -53,8 +125,10 @@ class I18nManager:
         Returns:
             変更成功時True
         """
-        if language in self._translations:
+        if language in self._available:
+            self._ensure_loaded(language)
             self.current_language = language
+            self._lookup.cache_clear()
             self._notify_observers()
             return True
         return False
@@ -70,48 +144,34 @@ class I18nManager:
         Returns:
             翻訳された文字列
         """
-        keys = key.split(".")
-        value = self._translations.get(self.current_language, {})
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    # フォールバック: デフォルト言語を試す
-                    value = self._get_fallback(key)
-                    break
-            else:
-                value = None
-                break
-
+        items = tuple(sorted(kwargs.items())) if kwargs else ()
+        try:
+            return self._lookup(self.current_language, key, items)
+        except TypeError:
+            # ハッシュ不可能な引数はキャッシュせずに処理
+            return self._lookup_uncached(self.current_language, key, items)
+
+    def _lookup_uncached(self, lang: str, key: str, kwargs_items: tuple) -> str:
+        """翻訳を検索してプレースホルダーを置換"""
+        value = self._ensure_loaded(lang).get(key)
         if value is None:
-            return key
+            # フォールバック: デフォルト言語を試す
+            value = self._get_fallback(key)
+            if value is None:
+                return key
 
         # プレースホルダー置換
-        if isinstance(value, str) and kwargs:
-            for k, v in kwargs.items():
-                value = value.replace(f"{{{k}}}", str(v))
+        if kwargs_items:
+            value = _format_template(value, dict(kwargs_items))
 
-        return value if isinstance(value, str) else key
+        return value
 
     def _get_fallback(self, key: str) -> Optional[str]:
         """デフォルト言語からフォールバック値を取得"""
-        keys = key.split(".")
-        value = self._translations.get(self.default_language, {})
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return None
-            else:
-                return None
-
-        return value if isinstance(value, str) else None
+        return self._ensure_loaded(self.default_language).get(key)
 
-    def t(self, key: str, **kwargs) -> str:
-        """get()のエイリアス"""
-        return self.get(key, **kwargs)
+    # get()のエイリアス（UIの各所から頻繁に呼ばれるため、呼び出しを1段減らす）
+    t = get
 
     def get_font(self) -> str:
         """現在の言語に適したフォントを取得"""
@@ -153,7 +213,7 @@ class I18nManager:
         return [
             (code, info["native_name"])
             for code, info in self.SUPPORTED_LANGUAGES.items()
-            if code in self._translations
+            if code in self._available
         ]
 
     def get_all_languages(self) -> list[tuple[str, str]]:
@@ -0,0 +1,56 @@
+"""JSON入出力ヘルパー（orjsonが利用可能なら高速パスを使用）"""
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson未インストール時は標準ライブラリにフォールバック
+    orjson = None
+
+# orjson.JSONDecodeError は json.JSONDecodeError のサブクラス
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes) -> Any:
+    """UTF-8のJSONバイト列をデコード"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """オブジェクトをUTF-8のJSONバイト列にエンコード（非ASCIIはそのまま出力）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    """JSONファイルを読み込み"""
+    return loads(path.read_bytes())
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """一時ファイルに書き込んでから置換（書き込み途中のクラッシュでも破損しない）"""
+    # 同じファイルへの同時書き込みで一時ファイルを取り合わないよう、書き込みごとに別名にする
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def write_json(path: Path, obj: Any, indent: bool = True) -> None:
+    """JSONファイルをアトミックに書き込み"""
+    atomic_write_bytes(path, dumps(obj, indent=indent))
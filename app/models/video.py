@@ -1,24 +1,31 @@
 """動画データモデル"""
-import json
 import re
 import base64
-from dataclasses import dataclass, field, asdict
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
+
+from app import jsonio
 
 _SAFE_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
 
 
-@dataclass
-class TranscriptEntry:
+class TranscriptEntry(NamedTuple):
+    # 1動画で数千件生成されるため軽量なタプルとして保持
     text: str
     start: float
     duration: float
+    # 表示用の開始時刻（mm:ss）。描画のたびに整形しないよう取得時に計算しておく
+    start_text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Video:
+    # 1件ごとの__dict__を持たない（リスト全件を常にメモリに保持するため）
     id: str
     url: str
     title: str
@@ -26,6 +33,19 @@ class Video:
     added_at: str = field(default_factory=lambda: datetime.now().isoformat())
     # 字幕はメモリキャッシュのみ（永続化しない）
     transcript: Optional[list[TranscriptEntry]] = None
+    # 連結済み字幕テキストのキャッシュ（元の字幕リストが差し替わったら再計算）
+    _full_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _full_text_source: Optional[list[TranscriptEntry]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def full_text(self) -> str:
+        """字幕を1つのテキストに連結したもの"""
+        if self.transcript is None:
+            return ""
+        if self._full_text_source is not self.transcript:
+            self._full_text = " ".join(entry.text for entry in self.transcript)
+            self._full_text_source = self.transcript
+        return self._full_text
 
     def to_dict(self) -> dict:
         """永続化用（字幕は含めない）"""
@@ -39,12 +59,16 @@ class Video:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Video":
+        added_at = data.get("added_at")
+        if added_at is None:
+            # 現在時刻の生成は欠損時のみ
+            added_at = datetime.now().isoformat()
         return cls(
             id=data["id"],
             url=data["url"],
             title=data["title"],
             thumbnail=data["thumbnail"],
-            added_at=data.get("added_at", datetime.now().isoformat()),
+            added_at=added_at,
         )
 
 
@@ -60,17 +84,15 @@ class SettingsStore:
     def load(self):
         if self.settings_path.exists():
             try:
-                with open(self.settings_path, "r", encoding="utf-8") as f:
-                    self._settings = json.load(f)
-            except (json.JSONDecodeError, KeyError) as e:
+                self._settings = jsonio.read_json(self.settings_path)
+            except (jsonio.JSONDecodeError, KeyError) as e:
                 print(f"[WARN] Failed to load settings: {e}")
                 self._settings = {}
         else:
             self._settings = {}
 
     def save(self):
-        with open(self.settings_path, "w", encoding="utf-8") as f:
-            json.dump(self._settings, f, ensure_ascii=False, indent=2)
+        jsonio.write_json(self.settings_path, self._settings)
 
     def get(self, key: str, default=None):
         value = self._settings.get(key, default)
@@ -91,9 +113,23 @@ class SettingsStore:
 class SummaryStore:
     """要約の永続化管理（1動画1ファイル）"""
 
+    # メモリに保持する要約の最大件数
+    CACHE_SIZE = 64
+
     def __init__(self, summaries_dir: Path):
         self.summaries_dir = summaries_dir
         self.summaries_dir.mkdir(parents=True, exist_ok=True)
+        # 動画ID -> (更新時刻, 要約) のLRUキャッシュ
+        self._cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cache_put(self, video_id: str, mtime: float, summary: str):
+        """キャッシュに格納（上限を超えたら最も古いものを破棄）"""
+        with self._cache_lock:
+            self._cache[video_id] = (mtime, summary)
+            self._cache.move_to_end(video_id)
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
 
     def _get_file_path(self, video_id: str) -> Path:
         """動画IDから要約ファイルのパスを取得"""
@@ -108,53 +144,150 @@ class SummaryStore:
         except ValueError as e:
             print(f"[WARN] {e}")
             return None
-        if file_path.exists():
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return f.read()
-            except Exception as e:
-                print(f"[WARN] Failed to read summary: {e}")
-                return None
-        return None
+        try:
+            mtime = file_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            print(f"[WARN] Failed to read summary: {e}")
+            return None
+
+        # 更新時刻が一致すればメモリから返す
+        with self._cache_lock:
+            cached = self._cache.get(video_id)
+            if cached is not None and cached[0] == mtime:
+                self._cache.move_to_end(video_id)
+                return cached[1]
+
+        try:
+            summary = file_path.read_bytes().decode("utf-8")
+        except Exception as e:
+            print(f"[WARN] Failed to read summary: {e}")
+            return None
+        self._cache_put(video_id, mtime, summary)
+        return summary
+
+    def exists(self, video_id: str) -> bool:
+        """要約が保存済みか（内容は読み込まない）"""
+        try:
+            return self._get_file_path(video_id).is_file()
+        except ValueError:
+            return False
 
     def set(self, video_id: str, summary: str):
         """要約を保存"""
         file_path = self._get_file_path(video_id)
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(summary)
+        jsonio.atomic_write_bytes(file_path, summary.encode("utf-8"))
+        self._cache_put(video_id, file_path.stat().st_mtime, summary)
 
     def remove(self, video_id: str):
         """要約を削除"""
         file_path = self._get_file_path(video_id)
+        with self._cache_lock:
+            self._cache.pop(video_id, None)
         if file_path.exists():
             file_path.unlink()
 
 
+class TranscriptCache:
+    """字幕のディスクキャッシュ（1動画1ファイル、期限切れ・上限超過分は破棄）"""
+
+    # キャッシュの有効期間（秒）
+    MAX_AGE = 7 * 24 * 60 * 60
+    # 保持する最大ファイル数
+    MAX_FILES = 200
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_file_path(self, video_id: str) -> Path:
+        """動画IDからキャッシュファイルのパスを取得"""
+        if not _SAFE_ID_RE.match(video_id):
+            raise ValueError(f"Invalid video ID for file path: {video_id}")
+        return self.cache_dir / f"{video_id}.json"
+
+    def get(self, video_id: str) -> Optional[list[TranscriptEntry]]:
+        """有効期間内のキャッシュがあれば字幕を返す"""
+        try:
+            file_path = self._get_file_path(video_id)
+            if time.time() - file_path.stat().st_mtime > self.MAX_AGE:
+                return None
+            data = jsonio.read_json(file_path)
+            return [TranscriptEntry(*row) for row in data]
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError, OSError) as e:
+            print(f"[WARN] Failed to read transcript cache: {e}")
+            return None
+
+    def set(self, video_id: str, transcript: list[TranscriptEntry]):
+        """字幕をキャッシュに保存"""
+        file_path = self._get_file_path(video_id)
+        jsonio.write_json(file_path, [list(entry) for entry in transcript], indent=False)
+        self._prune()
+
+    def remove(self, video_id: str):
+        """キャッシュを削除"""
+        file_path = self._get_file_path(video_id)
+        if file_path.exists():
+            file_path.unlink()
+
+    def clear(self):
+        """全キャッシュを削除"""
+        for file_path in self.cache_dir.glob("*.json"):
+            try:
+                file_path.unlink()
+            except OSError as e:
+                print(f"[WARN] Failed to remove transcript cache: {e}")
+
+    def _prune(self):
+        """上限を超えた古いキャッシュを削除"""
+        files = list(self.cache_dir.glob("*.json"))
+        if len(files) <= self.MAX_FILES:
+            return
+        files.sort(key=lambda f: f.stat().st_mtime)
+        for file_path in files[:len(files) - self.MAX_FILES]:
+            try:
+                file_path.unlink()
+            except OSError as e:
+                print(f"[WARN] Failed to remove transcript cache: {e}")
+
+
 class VideoStore:
     """動画リストの永続化管理"""
 
     MAX_VIDEOS = 50
+    # 連続した変更を1回の書き込みにまとめる待ち時間（秒）
+    SAVE_DELAY = 0.5
 
     def __init__(self, data_path: Path):
         self.data_path = data_path
         self.data_path.parent.mkdir(parents=True, exist_ok=True)
         self.videos: list[Video] = []
-        self._index: dict[str, int] = {}
+        # 動画ID -> Video の参照（変更時は差分のみ更新）
+        self._index: dict[str, Video] = {}
         # 字幕キャッシュ（メモリのみ）
         self._transcript_cache: dict[str, list[TranscriptEntry]] = {}
+        # 遅延保存の状態
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.RLock()
+        # ファイル書き込みの直列化（予約処理は書き込み完了を待たない）
+        self._write_lock = threading.Lock()
         self.load()
 
     def _rebuild_index(self):
-        """動画IDからインデックスへのマップを再構築"""
-        self._index = {v.id: i for i, v in enumerate(self.videos)}
+        """動画IDからVideoへのマップを再構築"""
+        self._index = {v.id: v for v in self.videos}
 
     def load(self):
         if self.data_path.exists():
             try:
-                with open(self.data_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.videos = [Video.from_dict(v) for v in data]
-            except (json.JSONDecodeError, KeyError) as e:
+                data = jsonio.read_json(self.data_path)
+                from_dict = Video.from_dict
+                self.videos = [from_dict(v) for v in data]
+            except (jsonio.JSONDecodeError, KeyError) as e:
                 print(f"[WARN] Failed to load videos: {e}")
                 self.videos = []
         else:
@@ -162,8 +295,36 @@ class VideoStore:
         self._rebuild_index()
 
     def save(self):
-        with open(self.data_path, "w", encoding="utf-8") as f:
-            json.dump([v.to_dict() for v in self.videos], f, ensure_ascii=False, indent=2)
+        """即座にアトミック書き込み（整形なしで出力サイズを抑える）"""
+        with self._write_lock:
+            with self._save_lock:
+                # タイマースレッドから呼ばれるため、UIスレッドの変更と競合しないよう先にスナップショットを取る
+                videos = list(self.videos)
+                self._dirty = False
+            # 書き込み中も _save_lock は解放しておき、UIスレッドからの保存予約を待たせない
+            # （スナップショットと書き込みは _write_lock 内で行うため、古い内容で上書きされることはない）
+            jsonio.write_json(self.data_path, [v.to_dict() for v in videos], indent=False)
+
+    def _schedule_save(self):
+        """保存を予約（SAVE_DELAY 内の連続変更は1回の書き込みにまとめる）"""
+        with self._save_lock:
+            self._dirty = True
+            # 予約済みのタイマーがあればそれに任せる（変更ごとにタイマースレッドを作らない）
+            if self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        """未保存の変更があれば書き込む"""
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            dirty = self._dirty
+        if dirty:
+            self.save()
 
     def add(self, video: Video):
         """動画を追加（最大50件、先頭に追加）"""
@@ -173,50 +334,57 @@ class VideoStore:
 
         # 先頭に追加
         self.videos.insert(0, video)
+        self._index[video.id] = video
 
         # 50件を超えたら古いものを削除
         if len(self.videos) > self.MAX_VIDEOS:
             removed = self.videos[self.MAX_VIDEOS:]
-            self.videos = self.videos[:self.MAX_VIDEOS]
-            # 削除された動画の字幕キャッシュもクリア
+            del self.videos[self.MAX_VIDEOS:]
+            # 削除された動画のインデックスと字幕キャッシュもクリア
             for v in removed:
+                self._index.pop(v.id, None)
                 self._transcript_cache.pop(v.id, None)
 
-        self._rebuild_index()
-        self.save()
+        self._schedule_save()
 
     def remove(self, video_id: str):
-        self.videos = [v for v in self.videos if v.id != video_id]
+        video = self._index.pop(video_id, None)
+        if video is None:
+            return
+        self.videos.remove(video)
         self._transcript_cache.pop(video_id, None)
-        self._rebuild_index()
-        self.save()
+        self._schedule_save()
 
     def move_to_top(self, video_id: str):
         """動画をリストの最上位に移動"""
-        idx = self._index.get(video_id)
-        if idx is not None and idx > 0:
-            video = self.videos.pop(idx)
+        video = self._index.get(video_id)
+        if video is not None and self.videos[0] is not video:
+            self.videos.remove(video)
             self.videos.insert(0, video)
-            self._rebuild_index()
-            self.save()
+            self._schedule_save()
+
+    def set_title(self, video_id: str, title: str):
+        """動画タイトルを更新"""
+        video = self._index.get(video_id)
+        if video is not None and video.title != title:
+            video.title = title
+            self._schedule_save()
 
     def get(self, video_id: str) -> Optional[Video]:
-        idx = self._index.get(video_id)
-        if idx is not None:
-            v = self.videos[idx]
+        v = self._index.get(video_id)
+        if v is not None:
             # キャッシュから字幕を復元
             v.transcript = self._transcript_cache.get(video_id)
-            return v
-        return None
+        return v
 
-    def set_transcript(self, video_id: str, transcript: list[TranscriptEntry]):
-        """字幕をキャッシュに保存"""
+    def set_transcript(self, video_id: str, transcript: list[TranscriptEntry]) -> Optional[Video]:
+        """字幕をキャッシュに保存（更新したVideoを返す。リストにない場合はNone）"""
         self._transcript_cache[video_id] = transcript
         # Videoオブジェクトにも設定
-        for v in self.videos:
-            if v.id == video_id:
-                v.transcript = transcript
-                break
+        v = self._index.get(video_id)
+        if v is not None:
+            v.transcript = transcript
+        return v
 
     def get_transcript(self, video_id: str) -> Optional[list[TranscriptEntry]]:
         """キャッシュから字幕を取得"""
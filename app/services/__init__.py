@@ -1,3 +1,3 @@
 from .youtube import extract_video_id, get_thumbnail_url
 from .transcript import get_transcript
-from .gemini import summarize_transcript
+from .gemini import summarize_transcript_stream
@@ -1,16 +1,25 @@
 """Gemini API サービス"""
+import threading
 import google.generativeai as genai
-from typing import Optional
+from typing import Iterator, Optional
 
+_MODEL_NAME = "gemini-2.5-flash"
 
 _api_key: Optional[str] = None
+# 要約に使うモデル（APIクライアントを内部に保持するため使い回し、APIキー変更時に作り直す）
+_model: Optional[genai.GenerativeModel] = None
+_model_lock = threading.Lock()
 
 
 def set_api_key(api_key: str):
-    """APIキーを設定"""
-    global _api_key
-    _api_key = api_key
-    genai.configure(api_key=api_key)
+    """APIキーを設定（変更がなければクライアントを再設定しない）"""
+    global _api_key, _model
+    if api_key == _api_key:
+        return
+    with _model_lock:
+        _api_key = api_key
+        genai.configure(api_key=api_key)
+        _model = None
 
 
 def get_api_key() -> Optional[str]:
@@ -18,24 +27,22 @@ def get_api_key() -> Optional[str]:
     return _api_key
 
 
-def summarize_transcript(transcript_text: str, prompt_template: Optional[str] = None) -> str:
-    """
-    字幕テキストを要約
-
-    Args:
-        transcript_text: 字幕テキスト
-        prompt_template: プロンプトテンプレート（{transcript}プレースホルダーを含む）
-    """
-    if not _api_key:
-        raise Exception("API_KEY_NOT_SET")
+def _get_model() -> genai.GenerativeModel:
+    """要約用のモデルを取得（初回のみ生成）"""
+    global _model
+    with _model_lock:
+        if _model is None:
+            _model = genai.GenerativeModel(_MODEL_NAME)
+        return _model
 
-    model = genai.GenerativeModel("gemini-2.5-flash")
 
+def _build_prompt(transcript_text: str, prompt_template: Optional[str] = None) -> str:
+    """要約用プロンプトを組み立て"""
     if prompt_template:
-        prompt = prompt_template.replace("{transcript}", transcript_text)
-    else:
-        # デフォルトプロンプト（日本語）
-        prompt = f"""以下はYouTube動画の字幕テキストです。この動画の内容を日本語で分かりやすく要約してください。
+        return prompt_template.replace("{transcript}", transcript_text)
+
+    # デフォルトプロンプト（日本語）
+    return f"""以下はYouTube動画の字幕テキストです。この動画の内容を日本語で分かりやすく要約してください。
 
 要約のフォーマット:
 - まず動画の主題を1-2文で説明
@@ -45,5 +52,24 @@ def summarize_transcript(transcript_text: str, prompt_template: Optional[str] =
 字幕テキスト:
 {transcript_text}"""
 
-    response = model.generate_content(prompt)
-    return response.text
+
+def summarize_transcript_stream(transcript_text: str, prompt_template: Optional[str] = None) -> Iterator[str]:
+    """
+    字幕テキストを要約（生成されたテキストを断片ごとに返す）
+
+    Args:
+        transcript_text: 字幕テキスト
+        prompt_template: プロンプトテンプレート（{transcript}プレースホルダーを含む）
+    """
+    if not _api_key:
+        raise Exception("API_KEY_NOT_SET")
+
+    response = _get_model().generate_content(_build_prompt(transcript_text, prompt_template), stream=True)
+    for chunk in response:
+        try:
+            text = chunk.text
+        except ValueError:
+            # テキストを含まない断片（終了通知など）は読み飛ばす
+            continue
+        if text:
+            yield text
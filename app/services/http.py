@@ -0,0 +1,45 @@
+"""共有HTTPセッション"""
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# ホストごとに保持する接続数（並列取得のワーカー数に合わせる）
+_POOL_SIZE = 8
+_USER_AGENT = "yt-summarizer/1.0"
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+# 終了処理で閉じた後は作り直さない（終了間際のワーカーが閉じられないセッションを残さないように）
+_closed = False
+
+
+def get_session() -> requests.Session:
+    """接続を再利用する共有セッションを取得"""
+    global _session
+    # 終了処理と並行しても None を返さないよう、参照は一度だけ読む
+    session = _session
+    if session is None:
+        with _session_lock:
+            if _closed:
+                raise RuntimeError("HTTP session is closed")
+            if _session is None:
+                session = requests.Session()
+                session.headers.update({"User-Agent": _USER_AGENT})
+                adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+            session = _session
+    return session
+
+
+def close_session():
+    """共有セッションの接続を閉じる（終了時に呼ぶ）"""
+    global _session, _closed
+    with _session_lock:
+        _closed = True
+        if _session is not None:
+            _session.close()
+            _session = None
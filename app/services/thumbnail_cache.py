@@ -0,0 +1,139 @@
+"""サムネイル取得・縮小キャッシュ"""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image
+
+from app import jsonio
+from app.constants import MAX_VIDEOS, THUMBNAIL_SIZE
+from app.services.http import get_session
+
+_SAFE_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# メモリに保持する縮小済みサムネイルの最大件数
+# （リストに同時に並ぶのは最大MAX_VIDEOS件で、それ以外はディスクキャッシュから読み直せる）
+MAX_CACHED_THUMBNAILS = MAX_VIDEOS
+# ディスクキャッシュの有効期間（秒）
+MAX_DISK_AGE = 30 * 24 * 60 * 60
+
+_cache: OrderedDict[str, Image.Image] = OrderedDict()
+_cache_lock = threading.Lock()
+# 縮小済み画像の保存先（再起動後は通信・縮小せずに読み込む）
+_cache_dir: Optional[Path] = None
+
+
+def set_cache_dir(path: Path):
+    """ディスクキャッシュの保存先を設定"""
+    global _cache_dir
+    path.mkdir(parents=True, exist_ok=True)
+    _cache_dir = path
+
+
+def _disk_path(video_id: str) -> Optional[Path]:
+    """動画IDからディスクキャッシュのパスを取得"""
+    if _cache_dir is None or not _SAFE_ID_RE.match(video_id):
+        return None
+    width, height = THUMBNAIL_SIZE
+    return _cache_dir / f"{video_id}_{width}x{height}.png"
+
+
+def get_cached(video_id: str) -> Optional[Image.Image]:
+    """キャッシュ済みのサムネイルを取得（なければNone）"""
+    with _cache_lock:
+        image = _cache.get(video_id)
+        if image is not None:
+            _cache.move_to_end(video_id)
+        return image
+
+
+def _put(video_id: str, image: Image.Image):
+    """キャッシュに格納（上限を超えたら最も古いものを破棄）"""
+    with _cache_lock:
+        _cache[video_id] = image
+        _cache.move_to_end(video_id)
+        while len(_cache) > MAX_CACHED_THUMBNAILS:
+            _cache.popitem(last=False)
+
+
+def get_thumbnail(video_id: str, url: str) -> Image.Image:
+    """サムネイルを表示サイズに縮小して取得（一度取得したものは再ダウンロードしない）"""
+    image = get_cached(video_id)
+    if image is not None:
+        return image
+
+    path = _disk_path(video_id)
+    if path is not None:
+        try:
+            with Image.open(path) as cached:
+                image = cached.copy()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[WARN] Failed to read thumbnail cache: {e}")
+        else:
+            # 使用中のサムネイルが期限切れで削除されないよう更新時刻を進める
+            try:
+                os.utime(path)
+            except OSError as e:
+                print(f"[WARN] Failed to touch thumbnail cache: {e}")
+            _put(video_id, image)
+            return image
+
+    response = get_session().get(url, timeout=5)
+    response.raise_for_status()
+    source = Image.open(BytesIO(response.content))
+    image = _fit(source).convert("RGB")
+    if path is not None:
+        # 縮小済みの画像を低圧縮のPNGで保存（次回以降はリサンプリング不要）
+        buffer = BytesIO()
+        image.save(buffer, "PNG", compress_level=1)
+        try:
+            jsonio.atomic_write_bytes(path, buffer.getvalue())
+        except OSError as e:
+            print(f"[WARN] Failed to save thumbnail cache: {e}")
+    _put(video_id, image)
+    return image
+
+
+def _fit(image: Image.Image) -> Image.Image:
+    """表示サイズの縦横比で中央を切り出して縮小（4:3画像の上下の黒帯を除去）"""
+    width, height = image.size
+    target_w, target_h = THUMBNAIL_SIZE
+    crop_h = min(height, round(width * target_h / target_w))
+    crop_w = min(width, round(crop_h * target_w / target_h))
+    left = (width - crop_w) // 2
+    top = (height - crop_h) // 2
+    # 元画像は小サイズ（120x90）で縮小率が低いため、LANCZOSほどの品質は不要
+    return image.resize(THUMBNAIL_SIZE, Image.Resampling.BICUBIC,
+                        box=(left, top, left + crop_w, top + crop_h))
+
+
+def evict(video_id: str):
+    """キャッシュから削除（ディスク上の画像も削除）"""
+    with _cache_lock:
+        _cache.pop(video_id, None)
+    path = _disk_path(video_id)
+    if path is not None:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"[WARN] Failed to remove thumbnail cache: {e}")
+
+
+def prune_disk_cache():
+    """期限切れのディスクキャッシュと旧形式（未縮小JPEG）のファイルを削除"""
+    if _cache_dir is None:
+        return
+    expire_before = time.time() - MAX_DISK_AGE
+    for path in _cache_dir.iterdir():
+        try:
+            if path.suffix == ".jpg" or path.stat().st_mtime < expire_before:
+                path.unlink()
+        except OSError as e:
+            print(f"[WARN] Failed to remove thumbnail cache: {e}")
@@ -1,6 +1,25 @@
 """字幕取得サービス"""
+import threading
+from typing import Optional
+
 from youtube_transcript_api import YouTubeTranscriptApi
 from app.models.video import TranscriptEntry
+from app.services.youtube import format_time
+
+# 字幕APIのクライアント（内部のHTTPセッションを使い回し、YouTubeへの接続を再利用する）
+# 共有セッション（app.services.http）はUser-Agentを独自に設定しているため別に保持する
+_api: Optional[YouTubeTranscriptApi] = None
+_api_lock = threading.Lock()
+
+
+def _get_api() -> YouTubeTranscriptApi:
+    """字幕APIのクライアントを取得（初回のみ生成）"""
+    global _api
+    if _api is None:
+        with _api_lock:
+            if _api is None:
+                _api = YouTubeTranscriptApi()
+    return _api
 
 
 def get_transcript(video_id: str, languages: list[str] = None) -> list[TranscriptEntry]:
@@ -9,15 +28,10 @@ def get_transcript(video_id: str, languages: list[str] = None) -> list[Transcrip
         languages = ["ja", "en"]
 
     try:
-        api = YouTubeTranscriptApi()
-        transcript_data = api.fetch(video_id, languages=languages)
+        transcript_data = _get_api().fetch(video_id, languages=languages)
 
         entries = [
-            TranscriptEntry(
-                text=entry.text,
-                start=entry.start,
-                duration=entry.duration,
-            )
+            TranscriptEntry(entry.text, entry.start, entry.duration, format_time(entry.start))
             for entry in transcript_data
         ]
 
@@ -1,10 +1,73 @@
 """YouTube関連ユーティリティ"""
 import re
-import urllib.request
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
+from app import jsonio
+from app.services.http import get_session
+
 _VIDEO_ID_RE = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+# URL形式（IDの直後が区切り文字か末尾）またはID単体を1回の走査で判定
+_EXTRACT_RE = re.compile(
+    r"(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([a-zA-Z0-9_-]{11})(?=[&\n?#]|$)"
+    r"|^([a-zA-Z0-9_-]{11})$"
+)
+
+# タイトルキャッシュ（動画ID -> タイトル、ディスクへ遅延書き込み）
+_TITLE_CACHE_SAVE_DELAY = 1.0
+# タイトル一括取得時の最大並列数
+_TITLE_FETCH_WORKERS = 8
+_title_cache: dict[str, str] = {}
+_title_cache_path: Optional[Path] = None
+_title_cache_lock = threading.Lock()
+_title_cache_timer: Optional[threading.Timer] = None
+# タイトル取得用の共有スレッドプール（呼び出しごとにスレッドを生成しない）
+_title_executor = ThreadPoolExecutor(max_workers=_TITLE_FETCH_WORKERS, thread_name_prefix="title")
+
+
+def set_title_cache_path(path: Path):
+    """タイトルキャッシュの保存先を設定して読み込み"""
+    global _title_cache_path
+    with _title_cache_lock:
+        _title_cache_path = path
+        if path.exists():
+            try:
+                _title_cache.update(jsonio.read_json(path))
+            except (jsonio.JSONDecodeError, OSError) as e:
+                print(f"[WARN] Failed to load title cache: {e}")
+
+
+def flush_title_cache():
+    """未保存のタイトルキャッシュを書き込み"""
+    global _title_cache_timer
+    with _title_cache_lock:
+        if _title_cache_timer is not None:
+            _title_cache_timer.cancel()
+            _title_cache_timer = None
+        if _title_cache_path is None:
+            return
+        try:
+            _title_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            jsonio.write_json(_title_cache_path, _title_cache, indent=False)
+        except OSError as e:
+            print(f"[WARN] Failed to save title cache: {e}")
+
+
+def _cache_title(video_id: str, title: str):
+    """タイトルをキャッシュし、書き込みを予約"""
+    global _title_cache_timer
+    with _title_cache_lock:
+        _title_cache[video_id] = title
+        if _title_cache_path is None:
+            return
+        if _title_cache_timer is not None:
+            _title_cache_timer.cancel()
+        _title_cache_timer = threading.Timer(_TITLE_CACHE_SAVE_DELAY, flush_title_cache)
+        _title_cache_timer.daemon = True
+        _title_cache_timer.start()
 
 
 def validate_video_id(video_id: str) -> bool:
@@ -12,30 +75,62 @@ def validate_video_id(video_id: str) -> bool:
     return bool(_VIDEO_ID_RE.match(video_id))
 
 
+def default_video_title(video_id: str) -> str:
+    """タイトル取得前・取得失敗時の仮タイトル"""
+    return f"Video {video_id}"
+
+
+def get_cached_video_title(video_id: str) -> Optional[str]:
+    """キャッシュ済みのタイトルを返す（通信しない）"""
+    return _title_cache.get(video_id)
+
+
 def get_video_title(video_id: str) -> str:
-    """YouTube oEmbed APIから動画タイトルを取得"""
+    """YouTube oEmbed APIから動画タイトルを取得（取得済みはキャッシュから返す）"""
+    cached = _title_cache.get(video_id)
+    if cached is not None:
+        return cached
     try:
-        url = f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={video_id}&format=json"
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            return data.get("title", f"Video {video_id}")
+        response = get_session().get(
+            "https://www.youtube.com/oembed",
+            params={"url": f"https://www.youtube.com/watch?v={video_id}", "format": "json"},
+            timeout=10,
+        )
+        response.raise_for_status()
+        data = response.json()
+        title = data.get("title")
+        if not title:
+            return default_video_title(video_id)
+        _cache_title(video_id, title)
+        return title
     except Exception as e:
         print(f"[WARN] get_video_title failed: {e}")
-        return f"Video {video_id}"
+        return default_video_title(video_id)
+
+
+def get_video_titles(video_ids: list[str]) -> dict[str, str]:
+    """複数動画のタイトルを並列取得（キャッシュ済みのものは通信しない）"""
+    titles = {vid: _title_cache[vid] for vid in video_ids if vid in _title_cache}
+    pending = [vid for vid in dict.fromkeys(video_ids) if vid not in titles]
+    if len(pending) == 1:
+        titles[pending[0]] = get_video_title(pending[0])
+    elif pending:
+        titles.update(zip(pending, _title_executor.map(get_video_title, pending)))
+    return titles
 
 
 def extract_video_id(url: str) -> Optional[str]:
     """YouTube URLから動画IDを抽出"""
-    patterns = [
-        r"(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)",
-        r"^([a-zA-Z0-9_-]{11})$",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            video_id = match.group(1)
-            if validate_video_id(video_id):
-                return video_id
+    # ID単体の入力はURL用の正規表現を通さずに判定
+    if len(url) == 11 and _VIDEO_ID_RE.match(url):
+        return url
+    # URL形式はいずれも "youtu" を含むため、含まない入力はID単体（末尾の改行1つまで許容）かだけを判定
+    if "youtu" not in url:
+        match = _VIDEO_ID_RE.match(url)
+        return match.group(0) if match else None
+    match = _EXTRACT_RE.search(url)
+    if match:
+        return match.group(1) or match.group(2)
     return None
 
 
@@ -44,13 +139,23 @@ def get_thumbnail_url(video_id: str) -> str:
     return f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg"
 
 
+def get_small_thumbnail_url(video_id: str) -> str:
+    """動画IDから小サイズ（120x90）のサムネイルURLを生成"""
+    return f"https://img.youtube.com/vi/{video_id}/default.jpg"
+
+
 def get_embed_url(video_id: str) -> str:
     """動画IDから埋め込みURLを生成"""
     return f"https://www.youtube.com/embed/{video_id}"
 
 
+@lru_cache(maxsize=2048)
+def _format_seconds(total: int) -> str:
+    """整数秒を mm:ss 形式にフォーマット"""
+    mins, secs = divmod(total, 60)
+    return f"{mins}:{secs:02d}"
+
+
 def format_time(seconds: float) -> str:
     """秒数を mm:ss 形式にフォーマット"""
-    mins = int(seconds // 60)
-    secs = int(seconds % 60)
-    return f"{mins}:{secs:02d}"
+    return _format_seconds(int(seconds))
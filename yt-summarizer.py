@@ -1,36 +1,107 @@
 """YT Summarizer - YouTube動画要約アプリ (tkinter版)"""
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, font as tkfont
 import webbrowser
-import threading
+from functools import lru_cache, partial
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 import re
 from pathlib import Path
-from io import BytesIO
-import requests
-from PIL import Image, ImageTk
+from PIL import ImageTk
 
-from app.models.video import Video, VideoStore, SummaryStore, SettingsStore
-from app.services.youtube import extract_video_id, get_thumbnail_url, get_video_title, format_time, validate_video_id
+from app.models.video import Video, VideoStore, SummaryStore, SettingsStore, TranscriptCache
+from app.services.youtube import (
+    extract_video_id, get_thumbnail_url, get_small_thumbnail_url, get_video_titles,
+    get_cached_video_title, default_video_title, validate_video_id,
+    set_title_cache_path, flush_title_cache
+)
+from app.services import thumbnail_cache
+from app.services.http import close_session
 from app.services.transcript import get_transcript
-from app.services.gemini import summarize_transcript, set_api_key, get_api_key
+from app.services.gemini import summarize_transcript_stream, set_api_key, get_api_key
 from app.i18n import I18nManager
 from app.constants import (
     COLORS, WINDOW_SIZE, WINDOW_MIN_SIZE,
     FONT_SCALE_MIN, FONT_SCALE_MAX, FONT_SCALE_STEP,
-    FONT_SCALE_DEFAULT, BASE_FONT_SIZE, THUMBNAIL_SIZE
+    FONT_SCALE_DEFAULT, FONT_SCALE_SAVE_DELAY_MS, BASE_FONT_SIZE, NETWORK_WORKERS, THUMBNAIL_WORKERS, SUMMARY_STREAM_INTERVAL
 )
 
 
+def _shorten(text: str, limit: int) -> str:
+    """指定文字数を超える場合のみ切り詰めて省略記号を付ける"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+@dataclass(slots=True)
+class _VideoItemRow:
+    """動画リストアイテムのウィジェットと表示状態"""
+    outer: tk.Frame
+    accent: tk.Frame
+    delete_btn: tk.Button
+    info_frame: ttk.Frame
+    title_label: ttk.Label
+    thumb_label: tk.Label
+    thumb_url: str
+    # (ウィジェット, ttkスタイルの種類) - 状態に応じてスタイル名を切り替える
+    styled_widgets: list[tuple[tk.Widget, str]] = field(default_factory=list)
+    badge: tk.Label | None = None
+    thumb_requested: bool = False
+
+
 class YTSummarizer:
     """YouTube動画要約アプリケーション"""
 
     # 定数をクラス変数として参照
     COLORS = COLORS
 
+    # マウスホイール1ノッチあたりのdelta（Windows）
+    _WHEEL_DELTA = 120
+
+    # パネルヘッダーの補助ボタン（一括取得・一括生成）の共通スタイル
+    _SECONDARY_BUTTON_STYLE = {
+        "bg": COLORS["surface_alt"],
+        "fg": COLORS["text"],
+        "relief": tk.FLAT,
+        "cursor": "hand2",
+        "padx": 14, "pady": 6,
+        "activebackground": COLORS["border"],
+        "activeforeground": COLORS["text"],
+    }
+
+    # 動画リストアイテムの状態（ttkスタイル名の接頭辞 -> (背景色, 左アクセントバーの色)）
+    # ホバー・選択のたびに辞書を引き直さないよう、色は事前に解決しておく
+    _VIDEO_ITEM_COLORS = {
+        "": (COLORS["surface"], COLORS["surface"]),
+        "Hover": (COLORS["hover"], COLORS["accent"]),
+        "Selected": (COLORS["selected"], COLORS["accent"]),
+    }
+    # 動画リストアイテム内のウィジェットが共有するバインドタグと、外枠のウィジェット名の接頭辞
+    _VIDEO_ITEM_TAG = "VideoItem"
+    _VIDEO_ITEM_PREFIX = "item_"
+
     # マークダウンインラインパース用正規表現（プリコンパイル）
-    _RE_INLINE_SPLIT = re.compile(r'(\*\*[^*]+\*\*|\*[^*]+\*|`[^`]+`)')
-    _RE_NUMBERED_LIST = re.compile(r'^\d+\.\s')
-    _RE_NUMBERED_LIST_NUM = re.compile(r'^(\d+)\.\s')
+    # グループ番号がそのまま種類を表す（1=太字, 2=斜体, 3=コード）
+    _RE_INLINE = re.compile(r'\*\*([^*]+)\*\*|\*([^*]+)\*|`([^`]+)`')
+    _INLINE_TAGS = (None, "bold", "italic", "code")
+    # 行頭の記法（見出し・区切り線・箇条書き・番号付きリスト）を1回のマッチで判定
+    # グループ: 1=見出しの#, 2=見出し本文, 3=区切り線, 4=箇条書き本文, 5=番号, 6=番号付きリスト本文
+    _RE_MARKDOWN_LINE = re.compile(
+        r"(#{1,3}) (.*)"
+        r"|\s*(?:(---|\*\*\*|___)"
+        r"|[-*] (?=.*\S)(.*?)"
+        r"|(\d+)\.\s(?=.*\S)(.*?))\s*$",
+        re.DOTALL,
+    )
+    _HEADING_TAGS = {1: "h1", 2: "h2", 3: "h3"}
+    # マークダウンタグのフォント（基準サイズとの差, スタイル）
+    _MARKDOWN_TAG_FONTS = {
+        "h1": (8, "bold"),
+        "h2": (5, "bold"),
+        "h3": (2, "bold"),
+        "bold": (0, "bold"),
+        "italic": (0, "italic"),
+    }
 
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -43,12 +114,17 @@ class YTSummarizer:
         self.video_store = VideoStore(data_dir / "videos.json")
         self.summary_store = SummaryStore(data_dir / "summaries")
         self.settings = SettingsStore(data_dir / "settings.json")
+        self.transcript_cache = TranscriptCache(data_dir / "transcripts")
+        set_title_cache_path(data_dir / "titles.json")
+        thumbnail_cache.set_cache_dir(data_dir / "thumbnails")
 
         # i18n初期化
         i18n_dir = Path(__file__).parent / "app" / "i18n" / "locales"
         self.i18n = I18nManager(i18n_dir, default_language="ja")
         saved_language = self.settings.get("language", "ja")
         self.i18n.set_language(saved_language)
+        # 言語ごとのフォント（言語変更時のみ更新）
+        self.font_family = self.i18n.get_font()
 
         # ウィンドウタイトル設定
         self.root.title(self.i18n.t("ui.app_title"))
@@ -56,8 +132,32 @@ class YTSummarizer:
         # 状態
         self.current_video_id: str | None = None
         self.font_scale = self.settings.get("font_scale", FONT_SCALE_DEFAULT)
+        self._font_scale_save_id: str | None = None
         self.thumbnail_cache: dict[str, ImageTk.PhotoImage] = {}
+        # サムネイルの取得・デコード・縮小用（PhotoImageの生成はメインスレッドで行う）
+        self._thumb_pool = ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS, thread_name_prefix="thumb")
+        self._thumb_pool.submit(thumbnail_cache.prune_disk_cache)
+        # 取得中のサムネイル（先読みと表示用の読み込みで同じ画像を二重にダウンロードしない）
+        self._thumb_jobs: dict[str, Future] = {}
+        # 字幕のディスクキャッシュ読み込み用（サムネイルの通信待ちの後ろに並ばないよう専用にする）
+        self._cache_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache")
         self._is_closing = False
+        # ネットワーク処理（字幕取得・要約生成）用（一括処理でも動画数分のスレッドを立てない）
+        self._network_pool = ThreadPoolExecutor(max_workers=NETWORK_WORKERS, thread_name_prefix="net")
+        # 取得中の字幕（同じ動画への重複リクエストを防ぐ）
+        self._fetching_transcripts: set[str] = set()
+        # 取得中のタイトル（削除後の再追加などで同じ動画を重複して問い合わせない）
+        self._fetching_titles: set[str] = set()
+        # 生成中の要約（同じ動画への重複リクエストを防ぐ）
+        self._generating_summaries: set[str] = set()
+        # 動画ID -> リストアイテムのウィジェット（選択変更時は該当行のみ更新）
+        self._video_rows: dict[str, _VideoItemRow] = {}
+        self._thumbnail_check_pending = False
+        self._thumbnails_prefetched = False
+        # ホバー中のアイテム（子ウィジェット間の移動で配色を切り替え直さない）
+        self._hovered_video_id: str | None = None
+        # ウィジェット -> 表示中の内容の元データ（マークダウン原文・字幕リスト・("plain", 文言)）
+        self._rendered_sources: dict[str, object] = {}
 
         # APIキー復元
         saved_api_key = self.settings.get("api_key", "")
@@ -66,11 +166,16 @@ class YTSummarizer:
 
         # UI構築
         self._setup_styles()
+        self._setup_list_fonts()
         self._build_ui()
-        self._refresh_video_list()
+        # 終了時の保存処理を確実に登録するため、イベントバインドは即座に行う
         self._bind_events()
+        # 動画リストはウィンドウの初回描画後に構築（起動直後から空のウィンドウを表示する）
+        self._safe_after_idle(self._refresh_video_list)
+        self._fetch_missing_titles()
 
-        # 言語変更時のコールバック登録
+        # 言語変更時のコールバック登録（UIに反映済みの言語を記録し、同じ言語での通知は無視する）
+        self._applied_language = self.i18n.current_language
         self.i18n.add_observer(self._on_language_changed)
 
     def _setup_styles(self):
@@ -105,6 +210,21 @@ class YTSummarizer:
         # PanedWindow
         style.configure("TPanedwindow", background=self.COLORS["border"])
 
+        # 動画リストアイテム（通常・ホバー・選択）- 配色はスタイル側で一元管理
+        for state, (bg_color, _) in self._VIDEO_ITEM_COLORS.items():
+            style.configure(f"VideoItem{state}.TFrame", background=bg_color)
+            style.configure(f"VideoItem{state}.TLabel", background=bg_color,
+                            foreground=self.COLORS["text"])
+
+    def _setup_list_fonts(self):
+        """動画リストの全アイテムで共有する名前付きフォントを作成"""
+        font_family = self.font_family
+        self.list_fonts = {
+            "title": tkfont.Font(root=self.root, family=font_family, size=10),
+            "delete": tkfont.Font(root=self.root, family=font_family, size=11),
+            "badge": tkfont.Font(root=self.root, family=font_family, size=8, weight="bold"),
+        }
+
     def _build_ui(self):
         """UIを構築"""
         # メインコンテナ
@@ -140,7 +260,7 @@ class YTSummarizer:
         logo.pack(side=tk.LEFT, padx=(0, 10))
 
         # タイトル - よりシャープなフォント
-        font_family = self.i18n.get_font()
+        font_family = self.font_family
         title = tk.Label(left_container, text=self.i18n.t("ui.app_title"),
                          bg=self.COLORS["primary"], fg=self.COLORS["text_inverse"],
                          font=(font_family, 17, "bold"))
@@ -167,7 +287,7 @@ class YTSummarizer:
 
     def _build_video_list_panel(self, parent):
         """動画リストパネル構築 - Refined Editorial Style"""
-        font_family = self.i18n.get_font()
+        font_family = self.font_family
         left_panel = tk.Frame(parent, bg=self.COLORS["surface"], width=320)
         left_panel.pack(side=tk.LEFT, fill=tk.Y)
         left_panel.pack_propagate(False)
@@ -210,13 +330,13 @@ class YTSummarizer:
             if self.url_entry.get() == self.url_placeholder:
                 self.url_entry.delete(0, tk.END)
                 self.url_entry.configure(fg=self.COLORS["text"])
-            self.url_entry_container.configure(bg=self.COLORS["accent"])
+            self.url_entry_container.configure(highlightbackground=self.COLORS["accent"])
 
         def on_focus_out(e):
             if not self.url_entry.get():
                 self.url_entry.insert(0, self.url_placeholder)
                 self.url_entry.configure(fg=self.COLORS["text_muted"])
-            self.url_entry_container.configure(bg=self.COLORS["border"])
+            self.url_entry_container.configure(highlightbackground=self.COLORS["border"])
 
         self.url_entry.bind("<FocusIn>", on_focus_in)
         self.url_entry.bind("<FocusOut>", on_focus_out)
@@ -244,11 +364,19 @@ class YTSummarizer:
         scrollbar = ttk.Scrollbar(list_container, orient=tk.VERTICAL, command=canvas.yview)
 
         self.video_list_frame = tk.Frame(canvas, bg=self.COLORS["surface"])
+        # スクロール範囲はフレームのサイズ変更イベントの値から直接設定（bbox("all")の走査を避ける）
         self.video_list_frame.bind("<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height)))
 
         canvas.create_window((0, 0), window=self.video_list_frame, anchor=tk.NW, width=290)
-        canvas.configure(yscrollcommand=scrollbar.set)
+
+        # スクロール位置が変わったら表示範囲のサムネイルを読み込む
+        def _on_yscroll(first, last):
+            scrollbar.set(first, last)
+            self._schedule_visible_thumbnails()
+
+        canvas.configure(yscrollcommand=_on_yscroll)
+        canvas.bind("<Configure>", lambda e: self._schedule_visible_thumbnails())
 
         # スクロールバーを先にpackして確実にスペースを確保
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -257,9 +385,7 @@ class YTSummarizer:
         self.video_list_canvas = canvas
 
         # マウスホイールスクロール（動画リスト専用）
-        def _on_video_list_scroll(event):
-            canvas.yview_scroll(-1 * (event.delta // 120), "units")
-            return "break"
+        _on_video_list_scroll = partial(self._on_wheel_scroll, canvas)
 
         def _bind_video_list_scroll(event):
             canvas.bind("<MouseWheel>", _on_video_list_scroll)
@@ -278,7 +404,7 @@ class YTSummarizer:
 
     def _build_content_panels(self, parent):
         """コンテンツパネル（要約 + 字幕）構築 - Refined Editorial Style"""
-        font_family = self.i18n.get_font()
+        font_family = self.font_family
         right_area = tk.Frame(parent, bg=self.COLORS["background"])
         right_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
@@ -337,20 +463,23 @@ class YTSummarizer:
                                           font=(font_family, 9))
         self.font_scale_label.pack(side=tk.RIGHT)
 
-    def _build_summary_panel(self, parent) -> ttk.Frame:
-        """要約パネル構築 - Refined Editorial Style"""
-        font_family = self.i18n.get_font()
+    def _build_card_panel(self, parent, title: str, accent_color: str):
+        """
+        カード風パネルの共通部分（外枠・ヘッダー・テキストエリア）を構築
 
-        # 外枠（カード風デザイン） - シャドウ効果を模倣
-        outer = tk.Frame(parent, bg=self.COLORS["border"])
-        outer_inner = tk.Frame(outer, bg=self.COLORS["surface"])
-        outer_inner.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
+        Returns:
+            (外枠, ヘッダー, タイトルラベル, テキストウィジェット)
+        """
+        font_family = self.font_family
 
-        frame = tk.Frame(outer_inner, bg=self.COLORS["surface"])
-        frame.pack(fill=tk.BOTH, expand=True)
+        # 外枠（カード風デザイン） - 1pxの枠線はハイライト枠で描画
+        outer = tk.Frame(parent, bg=self.COLORS["surface"],
+                         highlightthickness=1,
+                         highlightbackground=self.COLORS["border"],
+                         highlightcolor=self.COLORS["border"])
 
         # ヘッダー - より洗練されたデザイン
-        header = tk.Frame(frame, bg=self.COLORS["surface"])
+        header = tk.Frame(outer, bg=self.COLORS["surface"])
         header.pack(fill=tk.X, padx=20, pady=14)
 
         # ラベルとアイコン
@@ -358,14 +487,63 @@ class YTSummarizer:
         label_frame.pack(side=tk.LEFT)
 
         # アクセントバー（左側のカラーインジケーター）
-        accent_bar = tk.Frame(label_frame, bg=self.COLORS["accent"], width=4)
+        accent_bar = tk.Frame(label_frame, bg=accent_color, width=4)
         accent_bar.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 12))
 
-        self.summary_title_label = tk.Label(label_frame, text=self.i18n.t("ui.summary_panel.title"),
-                 font=(font_family, 14, "bold"),
-                 bg=self.COLORS["surface"],
-                 fg=self.COLORS["text"])
-        self.summary_title_label.pack(side=tk.LEFT)
+        title_label = tk.Label(label_frame, text=title,
+                               font=(font_family, 14, "bold"),
+                               bg=self.COLORS["surface"],
+                               fg=self.COLORS["text"])
+        title_label.pack(side=tk.LEFT)
+
+        # 区切り線
+        separator = tk.Frame(outer, bg=self.COLORS["border"], height=1)
+        separator.pack(fill=tk.X, padx=20)
+
+        # テキストエリア
+        text_frame = tk.Frame(outer, bg=self.COLORS["surface"])
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=16)
+
+        text_widget = tk.Text(text_frame, wrap=tk.WORD,
+                              font=(font_family, self._get_font_size()),
+                              relief=tk.FLAT,
+                              bg=self.COLORS["surface_alt"],
+                              fg=self.COLORS["text"],
+                              padx=18, pady=14,
+                              borderwidth=0,
+                              highlightthickness=1,
+                              highlightbackground=self.COLORS["border"],
+                              highlightcolor=self.COLORS["accent"],
+                              spacing1=6,
+                              spacing2=8,
+                              spacing3=10,
+                              height=1)
+        text_scroll = ttk.Scrollbar(text_frame, command=text_widget.yview)
+        text_widget.configure(yscrollcommand=text_scroll.set)
+
+        # スクロールバーを先にpackして確実にスペースを確保
+        text_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        text_widget.insert("1.0", self.i18n.t("ui.content.select_video"))
+        text_widget.configure(state=tk.DISABLED)
+
+        # Ctrl+ホイールでフォントサイズ変更
+        text_widget.bind("<Control-MouseWheel>", self._on_font_scale)
+
+        # マウスホイールスクロール（テキストエリア専用）
+        text_widget.bind("<MouseWheel>", partial(self._on_wheel_scroll, text_widget))
+
+        return outer, header, title_label, text_widget
+
+    def _build_summary_panel(self, parent) -> ttk.Frame:
+        """要約パネル構築 - Refined Editorial Style"""
+        font_family = self.font_family
+        outer, header, self.summary_title_label, self.summary_text = self._build_card_panel(
+            parent, self.i18n.t("ui.summary_panel.title"), self.COLORS["accent"]
+        )
+        # マークダウン用タグは作成時に1回だけ設定（以降はフォント・言語変更時のみ再設定）
+        self._configure_markdown_tags(self.summary_text)
 
         # 生成ボタン - より目立つスタイル
         self.generate_btn = tk.Button(header, text=f"✨ {self.i18n.t('ui.summary_panel.generate')}",
@@ -381,155 +559,93 @@ class YTSummarizer:
         self.generate_btn.pack(side=tk.RIGHT)
         self._bind_hover(self.generate_btn, self.COLORS["accent_hover"], self.COLORS["accent"], check_state=True)
 
-        # 区切り線
-        separator = tk.Frame(frame, bg=self.COLORS["border"], height=1)
-        separator.pack(fill=tk.X, padx=20)
-
-        # テキストエリア
-        text_frame = tk.Frame(frame, bg=self.COLORS["surface"])
-        text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=16)
-
-        self.summary_text = tk.Text(text_frame, wrap=tk.WORD,
-                                     font=(font_family, self._get_font_size()),
-                                     relief=tk.FLAT,
-                                     bg=self.COLORS["surface_alt"],
-                                     fg=self.COLORS["text"],
-                                     padx=18, pady=14,
-                                     borderwidth=0,
-                                     highlightthickness=1,
-                                     highlightbackground=self.COLORS["border"],
-                                     highlightcolor=self.COLORS["accent"],
-                                     spacing1=6,
-                                     spacing2=8,
-                                     spacing3=10,
-                                     height=1)
-        summary_scroll = ttk.Scrollbar(text_frame, command=self.summary_text.yview)
-        self.summary_text.configure(yscrollcommand=summary_scroll.set)
-
-        # スクロールバーを先にpackして確実にスペースを確保
-        summary_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.summary_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        self.summary_text.insert("1.0", self.i18n.t("ui.content.select_video"))
-        self.summary_text.configure(state=tk.DISABLED)
-
-        # Ctrl+ホイールでフォントサイズ変更
-        self.summary_text.bind("<Control-MouseWheel>", self._on_font_scale)
-
-        # マウスホイールスクロール（要約エリア専用）
-        def _on_summary_scroll(event):
-            self.summary_text.yview_scroll(-1 * (event.delta // 120), "units")
-            return "break"
-
-        self.summary_text.bind("<MouseWheel>", _on_summary_scroll)
+        # 一括生成ボタン（字幕取得済みで要約のない動画をまとめて生成）
+        self.generate_all_btn = tk.Button(header, text=f"✨ {self.i18n.t('ui.summary_panel.generate_all')}",
+                                           font=(font_family, 10),
+                                           command=self._generate_all_summaries,
+                                           **self._SECONDARY_BUTTON_STYLE)
+        self.generate_all_btn.pack(side=tk.RIGHT, padx=(0, 8))
+        self._bind_hover(self.generate_all_btn, self.COLORS["border"], self.COLORS["surface_alt"])
 
         return outer
 
     def _build_transcript_panel(self, parent) -> ttk.Frame:
         """字幕パネル構築 - Refined Editorial Style"""
-        font_family = self.i18n.get_font()
-
-        # 外枠（カード風デザイン）
-        outer = tk.Frame(parent, bg=self.COLORS["border"])
-        outer_inner = tk.Frame(outer, bg=self.COLORS["surface"])
-        outer_inner.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
-
-        frame = tk.Frame(outer_inner, bg=self.COLORS["surface"])
-        frame.pack(fill=tk.BOTH, expand=True)
-
-        # ヘッダー - より洗練されたデザイン
-        header = tk.Frame(frame, bg=self.COLORS["surface"])
-        header.pack(fill=tk.X, padx=20, pady=14)
-
-        # ラベルとアイコン
-        label_frame = tk.Frame(header, bg=self.COLORS["surface"])
-        label_frame.pack(side=tk.LEFT)
-
-        # アクセントバー（左側のカラーインジケーター）- 字幕用は別色
-        accent_bar = tk.Frame(label_frame, bg=self.COLORS["text_secondary"], width=4)
-        accent_bar.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 12))
-
-        self.transcript_title_label = tk.Label(label_frame, text=self.i18n.t("ui.transcript_panel.title"),
-                 font=(font_family, 14, "bold"),
-                 bg=self.COLORS["surface"],
-                 fg=self.COLORS["text"])
-        self.transcript_title_label.pack(side=tk.LEFT)
-
-        # 区切り線
-        separator = tk.Frame(frame, bg=self.COLORS["border"], height=1)
-        separator.pack(fill=tk.X, padx=20)
-
-        # テキストエリア
-        text_frame = tk.Frame(frame, bg=self.COLORS["surface"])
-        text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=16)
-
-        self.transcript_text = tk.Text(text_frame, wrap=tk.WORD,
-                                        font=(font_family, self._get_font_size()),
-                                        relief=tk.FLAT,
-                                        bg=self.COLORS["surface_alt"],
-                                        fg=self.COLORS["text"],
-                                        padx=18, pady=14,
-                                        borderwidth=0,
-                                        highlightthickness=1,
-                                        highlightbackground=self.COLORS["border"],
-                                        highlightcolor=self.COLORS["accent"],
-                                        spacing1=6,
-                                        spacing2=8,
-                                        spacing3=10,
-                                        height=1)
-        transcript_scroll = ttk.Scrollbar(text_frame, command=self.transcript_text.yview)
-        self.transcript_text.configure(yscrollcommand=transcript_scroll.set)
-
-        # スクロールバーを先にpackして確実にスペースを確保
-        transcript_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.transcript_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        font_family = self.font_family
+        # アクセントバーは字幕用に別色
+        outer, header, self.transcript_title_label, self.transcript_text = self._build_card_panel(
+            parent, self.i18n.t("ui.transcript_panel.title"), self.COLORS["text_secondary"]
+        )
 
-        self.transcript_text.insert("1.0", self.i18n.t("ui.content.select_video"))
-        self.transcript_text.configure(state=tk.DISABLED)
+        # 一括取得ボタン（字幕未取得の動画をまとめて取得）
+        self.fetch_all_btn = tk.Button(header, text=f"⬇ {self.i18n.t('ui.transcript_panel.fetch_all')}",
+                                        font=(font_family, 10),
+                                        command=self._fetch_all_transcripts,
+                                        **self._SECONDARY_BUTTON_STYLE)
+        self.fetch_all_btn.pack(side=tk.RIGHT)
+        self._bind_hover(self.fetch_all_btn, self.COLORS["border"], self.COLORS["surface_alt"])
 
         # タグ設定（タイムスタンプ用） - より目立つスタイル
         self.transcript_text.tag_configure("timestamp",
                                             foreground=self.COLORS["accent"],
                                             font=(font_family, self._get_font_size(), "bold"))
 
-        # Ctrl+ホイールでフォントサイズ変更
-        self.transcript_text.bind("<Control-MouseWheel>", self._on_font_scale)
-
-        # マウスホイールスクロール（字幕エリア専用）
-        def _on_transcript_scroll(event):
-            self.transcript_text.yview_scroll(-1 * (event.delta // 120), "units")
-            return "break"
-
-        self.transcript_text.bind("<MouseWheel>", _on_transcript_scroll)
-
         return outer
 
     def _bind_events(self):
         """イベントバインド"""
         # ウィンドウ閉じる時
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        # 動画リストアイテムのクリック・ホバー（全アイテム共通で1回だけバインド）
+        self.root.bind_class(self._VIDEO_ITEM_TAG, "<Button-1>", self._on_video_item_click)
+        self.root.bind_class(self._VIDEO_ITEM_TAG, "<Enter>", partial(self._on_video_item_hover, True))
+        self.root.bind_class(self._VIDEO_ITEM_TAG, "<Leave>", partial(self._on_video_item_hover, False))
+        # 削除ボタンは共通のTclコマンドに動画IDを渡して呼び出す（ボタンごとにコマンドを登録しない）
+        self._delete_video_cmd = self.root.register(self._on_video_item_delete)
 
     # --- ヘルパーメソッド ---
 
     def _bind_hover(self, widget, enter_color, leave_color, check_state=False, config_key="bg"):
-        """ホバー効果をバインド"""
-        def on_enter(e):
-            if check_state and widget["state"] == tk.DISABLED:
-                return
-            widget.configure(**{config_key: enter_color})
-        def on_leave(e):
-            if check_state and widget["state"] == tk.DISABLED:
-                return
-            widget.configure(**{config_key: leave_color})
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+        """ホバー効果をバインド（WindowsのButtonはactivebackgroundがホバーで反映されないため手動で切り替える）"""
+        widget.bind("<Enter>", partial(self._on_hover, config_key, enter_color, check_state))
+        widget.bind("<Leave>", partial(self._on_hover, config_key, leave_color, check_state))
+
+    @staticmethod
+    def _on_hover(config_key, color, check_state, event):
+        """ホバー時の配色切り替え（共通ハンドラ）"""
+        widget = event.widget
+        if check_state and widget["state"] == tk.DISABLED:
+            return
+        widget.configure(**{config_key: color})
+
+    @classmethod
+    def _on_wheel_scroll(cls, widget, event):
+        """マウスホイールで対象ウィジェットのみをスクロール（共通ハンドラ）"""
+        widget.yview_scroll(-(event.delta // cls._WHEEL_DELTA), "units")
+        return "break"
 
     def _set_text_content(self, widget, text):
-        """テキストウィジェットの内容を設定"""
+        """テキストウィジェットの内容を設定（同じ文言を表示中なら何もしない）"""
+        widget_key = str(widget)
+        source = ("plain", text)
+        if self._rendered_sources.get(widget_key) == source:
+            return
         widget.configure(state=tk.NORMAL)
-        widget.delete("1.0", tk.END)
-        widget.insert("1.0", text)
-        widget.configure(state=tk.DISABLED)
+        try:
+            widget.delete("1.0", tk.END)
+            widget.insert("1.0", text)
+        finally:
+            widget.configure(state=tk.DISABLED)
+        self._rendered_sources[widget_key] = source
+
+    def _update_generate_btn(self, video_id: str):
+        """生成ボタンを動画の生成状態に合わせる"""
+        if video_id in self._generating_summaries:
+            self.generate_btn.configure(state=tk.DISABLED,
+                                         text=f"⏳ {self.i18n.t('ui.summary_panel.generating')}",
+                                         bg=self.COLORS["text_muted"])
+        else:
+            self._reset_generate_btn()
 
     def _reset_generate_btn(self):
         """生成ボタンを初期状態にリセット"""
@@ -541,13 +657,14 @@ class YTSummarizer:
 
     def _create_bordered_entry(self, parent, font, show=None, pack_kwargs=None):
         """ボーダー付きエントリーフィールドを作成"""
-        container = tk.Frame(parent, bg=self.COLORS["border"])
+        # 1pxの枠線はハイライト枠で描画（フォーカス時はアクセントカラー）
+        container = tk.Frame(parent, bg=self.COLORS["surface_alt"],
+                             highlightthickness=1,
+                             highlightbackground=self.COLORS["border"],
+                             highlightcolor=self.COLORS["border"])
         if pack_kwargs:
             container.pack(**pack_kwargs)
 
-        inner = tk.Frame(container, bg=self.COLORS["surface_alt"])
-        inner.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
-
         entry_kwargs = {
             "font": font,
             "relief": tk.FLAT,
@@ -558,19 +675,28 @@ class YTSummarizer:
         if show:
             entry_kwargs["show"] = show
 
-        entry = tk.Entry(inner, **entry_kwargs)
+        entry = tk.Entry(container, **entry_kwargs)
         entry.pack(fill=tk.X, padx=12, pady=10)
 
         def on_focus_in(e):
-            container.configure(bg=self.COLORS["accent"])
+            container.configure(highlightbackground=self.COLORS["accent"])
         def on_focus_out(e):
-            container.configure(bg=self.COLORS["border"])
+            container.configure(highlightbackground=self.COLORS["border"])
 
         entry.bind("<FocusIn>", on_focus_in)
         entry.bind("<FocusOut>", on_focus_out)
 
         return container, entry
 
+    def _safe_after_idle(self, callback):
+        """アイドル時にコールバックを実行（終了処理中は無視）"""
+        if self._is_closing:
+            return
+        try:
+            self.root.after_idle(callback)
+        except tk.TclError:
+            pass
+
     def _safe_after(self, delay, callback):
         """スレッドセーフなroot.after()呼び出し"""
         if self._is_closing:
@@ -580,107 +706,129 @@ class YTSummarizer:
         except tk.TclError:
             pass
 
+    def _run_in_background(self, func):
+        """ネットワーク処理をワーカースレッドで実行（同時実行数を制限）"""
+        if self._is_closing:
+            return
+        try:
+            self._network_pool.submit(func)
+        except RuntimeError:
+            # 終了処理でプールが停止済み
+            pass
+
     def _get_font_size(self) -> int:
         """現在のフォントサイズを計算"""
         return max(8, int(BASE_FONT_SIZE * self.font_scale / 100))
 
     def _configure_markdown_tags(self, text_widget: tk.Text):
-        """マークダウン用タグを設定 - Refined Editorial Style"""
-        size = self._get_font_size()
-        font_family = self.i18n.get_font()
-
+        """マークダウン用タグを設定 - Refined Editorial Style（フォントは _apply_markdown_fonts で設定）"""
         # 見出しタグ - より洗練されたスタイル
-        text_widget.tag_configure("h1", font=(font_family, size + 8, "bold"),
-                                   foreground=self.COLORS["text"],
+        text_widget.tag_configure("h1", foreground=self.COLORS["text"],
                                    spacing1=20, spacing2=6, spacing3=14)
-        text_widget.tag_configure("h2", font=(font_family, size + 5, "bold"),
-                                   foreground=self.COLORS["text"],
+        text_widget.tag_configure("h2", foreground=self.COLORS["text"],
                                    spacing1=16, spacing2=6, spacing3=12)
-        text_widget.tag_configure("h3", font=(font_family, size + 2, "bold"),
-                                   foreground=self.COLORS["text_secondary"],
+        text_widget.tag_configure("h3", foreground=self.COLORS["text_secondary"],
                                    spacing1=14, spacing2=4, spacing3=10)
 
         # 太字・斜体 - 太字は読みやすいフォントと色で強調
-        text_widget.tag_configure("bold", font=(font_family, size, "bold"),
-                                   foreground=self.COLORS["primary"])
-        text_widget.tag_configure("italic", font=(font_family, size, "italic"),
-                                   foreground=self.COLORS["text_secondary"])
+        text_widget.tag_configure("bold", foreground=self.COLORS["primary"])
+        text_widget.tag_configure("italic", foreground=self.COLORS["text_secondary"])
 
         # 箇条書き - より余白を設定
         text_widget.tag_configure("bullet", lmargin1=24, lmargin2=40,
                                    spacing1=4, spacing2=4, spacing3=6)
 
         # コード - アクセントカラーを使用
-        text_widget.tag_configure("code", font=("Consolas", size - 1),
-                                   background=self.COLORS["surface_alt"],
+        text_widget.tag_configure("code", background=self.COLORS["surface_alt"],
                                    foreground=self.COLORS["accent"])
 
         # 区切り線
         text_widget.tag_configure("hr", foreground=self.COLORS["border"], justify=tk.CENTER,
                                    spacing1=12, spacing3=12)
 
-    def _render_markdown(self, text_widget: tk.Text, markdown_text: str):
-        """マークダウンテキストをレンダリング"""
-        text_widget.configure(state=tk.NORMAL)
-        text_widget.delete("1.0", tk.END)
+        self._apply_markdown_fonts(text_widget)
 
-        self._configure_markdown_tags(text_widget)
+    def _apply_markdown_fonts(self, text_widget: tk.Text):
+        """マークダウン用タグのフォントのみ更新（色・余白は再送しない）"""
+        size = self._get_font_size()
+        font_family = self.font_family
+        for tag, (delta, style) in self._MARKDOWN_TAG_FONTS.items():
+            text_widget.tag_configure(tag, font=(font_family, size + delta, style))
+        text_widget.tag_configure("code", font=("Consolas", size - 1))
 
-        lines = markdown_text.split("\n")
-        for i, line in enumerate(lines):
+    def _apply_text_fonts(self):
+        """要約・字幕エリアのフォントを現在のフォントとサイズに合わせる"""
+        size = self._get_font_size()
+        font = (self.font_family, size)
+        self.summary_text.configure(font=font)
+        self.transcript_text.configure(font=font)
+        self.transcript_text.tag_configure("timestamp", font=(self.font_family, size, "bold"))
+        self._apply_markdown_fonts(self.summary_text)
+
+    def _render_markdown(self, text_widget: tk.Text, markdown_text: str):
+        """マークダウンテキストをレンダリング（タグは設定済みのものを使用）"""
+        # 表示中と同じ内容なら再構築しない（同じ動画の再選択・言語変更時など）
+        if self._rendered_sources.get(str(text_widget)) == markdown_text:
+            return
+        chunks = self._parse_markdown(markdown_text)
+        text_widget.configure(state=tk.NORMAL)
+        try:
+            text_widget.delete("1.0", tk.END)
+            text_widget.insert(tk.END, *chunks)
+        finally:
+            text_widget.configure(state=tk.DISABLED)
+        self._rendered_sources[str(text_widget)] = markdown_text
+
+    @classmethod
+    @lru_cache(maxsize=16)
+    def _parse_markdown(cls, markdown_text: str) -> tuple:
+        """
+        マークダウンを解析して (テキスト, タグ, テキスト, タグ, ...) の並びに変換
+
+        Tkに依存しないため要約生成スレッドで先に実行でき、結果はキャッシュされる
+        （Text.insertにそのまま渡して1回の呼び出しで挿入できる）
+        """
+        chunks = []
+        match_line = cls._RE_MARKDOWN_LINE.match
+        for line in markdown_text.split("\n"):
+            m = match_line(line)
+            # 通常テキスト
+            if m is None:
+                cls._append_inline_markdown(chunks, line)
+                chunks += ("\n", "")
+                continue
+            heading, heading_text, hr, bullet_text, num, num_text = m.groups()
             # 見出し
-            if line.startswith("### "):
-                text_widget.insert(tk.END, line[4:] + "\n", "h3")
-            elif line.startswith("## "):
-                text_widget.insert(tk.END, line[3:] + "\n", "h2")
-            elif line.startswith("# "):
-                text_widget.insert(tk.END, line[2:] + "\n", "h1")
+            if heading:
+                chunks += (heading_text + "\n", cls._HEADING_TAGS[len(heading)])
             # 区切り線
-            elif line.strip() in ["---", "***", "___"]:
-                text_widget.insert(tk.END, "─" * 50 + "\n", "hr")
+            elif hr:
+                chunks += ("─" * 50 + "\n", "hr")
             # 箇条書き
-            elif line.strip().startswith("- ") or line.strip().startswith("* "):
-                content = line.strip()[2:]
-                self._insert_inline_markdown(text_widget, "• " + content, "bullet")
-                text_widget.insert(tk.END, "\n")
+            elif bullet_text is not None:
+                cls._append_inline_markdown(chunks, "• " + bullet_text, "bullet")
+                chunks += ("\n", "")
             # 番号付きリスト
-            elif self._RE_NUMBERED_LIST.match(line.strip()):
-                content = self._RE_NUMBERED_LIST.sub('', line.strip())
-                num = self._RE_NUMBERED_LIST_NUM.match(line.strip()).group(1)
-                self._insert_inline_markdown(text_widget, f"{num}. " + content, "bullet")
-                text_widget.insert(tk.END, "\n")
-            # 通常テキスト
-            else:
-                self._insert_inline_markdown(text_widget, line)
-                text_widget.insert(tk.END, "\n")
-
-        text_widget.configure(state=tk.DISABLED)
-
-    def _insert_inline_markdown(self, text_widget: tk.Text, text: str, base_tag: str = None):
-        """インラインマークダウン（太字、斜体、コード）を処理"""
-        parts = self._RE_INLINE_SPLIT.split(text)
-
-        for part in parts:
-            if not part:
-                continue
-
-            tag = base_tag
-            display_text = part
-
-            if part.startswith("**") and part.endswith("**"):
-                display_text = part[2:-2]
-                tag = "bold" if not base_tag else (base_tag, "bold")
-            elif part.startswith("*") and part.endswith("*") and not part.startswith("**"):
-                display_text = part[1:-1]
-                tag = "italic" if not base_tag else (base_tag, "italic")
-            elif part.startswith("`") and part.endswith("`"):
-                display_text = part[1:-1]
-                tag = "code" if not base_tag else (base_tag, "code")
-
-            if tag:
-                text_widget.insert(tk.END, display_text, tag)
             else:
-                text_widget.insert(tk.END, display_text)
+                cls._append_inline_markdown(chunks, f"{num}. " + num_text, "bullet")
+                chunks += ("\n", "")
+        return tuple(chunks)
+
+    @classmethod
+    def _append_inline_markdown(cls, chunks: list, text: str, base_tag: str = None):
+        """インラインマークダウン（太字、斜体、コード）を処理し、テキストとタグをchunksに追加"""
+        plain_tag = base_tag or ""
+        pos = 0
+        for m in cls._RE_INLINE.finditer(text):
+            start = m.start()
+            if start > pos:
+                chunks += (text[pos:start], plain_tag)
+            kind = m.lastindex
+            inline_tag = cls._INLINE_TAGS[kind]
+            chunks += (m.group(kind), (base_tag, inline_tag) if base_tag else inline_tag)
+            pos = m.end()
+        if pos < len(text):
+            chunks += (text[pos:], plain_tag)
 
     def _on_font_scale(self, event):
         """フォントサイズ変更"""
@@ -689,151 +837,324 @@ class YTSummarizer:
         else:
             self.font_scale = max(FONT_SCALE_MIN, self.font_scale - FONT_SCALE_STEP)
 
-        self.settings.set("font_scale", self.font_scale)
         self._update_font_size()
+        # 連続したホイール操作中は保存せず、操作が止まってから1回だけ書き込む
+        if self._font_scale_save_id is not None:
+            self.root.after_cancel(self._font_scale_save_id)
+        self._font_scale_save_id = self.root.after(FONT_SCALE_SAVE_DELAY_MS, self._save_font_scale)
         return "break"
 
+    def _save_font_scale(self):
+        """フォントサイズを設定に保存"""
+        self._font_scale_save_id = None
+        self.settings.set("font_scale", self.font_scale)
+
     def _update_font_size(self):
         """フォントサイズを適用"""
-        size = self._get_font_size()
-        font_family = self.i18n.get_font()
-
-        self.summary_text.configure(font=(font_family, size))
-        self.transcript_text.configure(font=(font_family, size))
-        self.transcript_text.tag_configure("timestamp",
-                                            font=(font_family, size, "bold"),
-                                            foreground=self.COLORS["accent"])
-
-        # マークダウンタグも更新
-        self._configure_markdown_tags(self.summary_text)
-
+        self._apply_text_fonts()
         self.font_scale_label.configure(text=self.i18n.t("ui.content.font_size", scale=self.font_scale))
 
     def _refresh_video_list(self):
-        """動画リストを更新"""
-        # 既存のウィジェットを削除
-        for widget in self.video_list_frame.winfo_children():
-            widget.destroy()
+        """動画リストをストアと同期（差分のアイテムのみ作成・破棄し、既存アイテムは再利用）"""
+        videos = self.video_store.videos
+        stored_ids = {v.id for v in videos}
+        for video_id in [vid for vid in self._video_rows if vid not in stored_ids]:
+            self._remove_video_item(video_id)
+        for video in videos:
+            if video.id not in self._video_rows:
+                self._create_video_item(video)
+
+        # 並び順がずれている位置以降のみ詰め直す
+        desired = [self._video_rows[v.id].outer for v in videos]
+        current = self.video_list_frame.pack_slaves()
+        for i, outer in enumerate(desired):
+            if i < len(current) and current[i] is outer:
+                continue
+            previous = desired[i - 1] if i else None
+            for widget in desired[i:]:
+                if previous is None:
+                    widget.pack_configure(before=current[0])
+                else:
+                    widget.pack_configure(after=previous)
+                previous = widget
+            break
 
-        # 動画数バッジを更新
+        self._update_video_count()
+
+    def _update_video_count(self):
+        """動画数バッジを更新"""
         if hasattr(self, 'video_count_label'):
             count = len(self.video_store.videos)
             self.video_count_label.configure(text=self.i18n.t("ui.sidebar.video_count", count=count))
 
-        # 動画リストを表示
-        for video in self.video_store.videos:
-            self._create_video_item(video)
+    def _first_video_row(self):
+        """リスト先頭のアイテム（外枠）を取得"""
+        rows = self.video_list_frame.pack_slaves()
+        return rows[0] if rows else None
+
+    def _insert_video_item(self, video: Video):
+        """動画リストの先頭にアイテムを1件追加"""
+        self._create_video_item(video, before=self._first_video_row())
+
+    def _remove_video_item(self, video_id: str):
+        """動画リストからアイテムを1件削除"""
+        row = self._video_rows.pop(video_id, None)
+        if row is not None:
+            row.outer.destroy()
+        # リストから外れた動画のTk画像を解放
+        self.thumbnail_cache.pop(video_id, None)
+
+    def _update_video_item(self, video: Video):
+        """既存アイテムのタイトルと要約済みバッジをその場で更新（ウィジェットは作り直さない）"""
+        row = self._video_rows.get(video.id)
+        if row is None:
+            return
+        row.title_label.configure(text=self._video_item_title(video))
+        if row.badge is None and self.summary_store.exists(video.id):
+            self._add_video_item_badge(video.id)
+
+    def _move_video_item_to_top(self, video_id: str):
+        """アイテムをリスト先頭へ移動"""
+        row = self._video_rows.get(video_id)
+        first = self._first_video_row()
+        if row is not None and first is not None and first is not row.outer:
+            row.outer.pack_configure(before=first)
+
+    def _apply_video_item_style(self, video_id: str):
+        """選択状態に応じてアイテムの配色を更新"""
+        row = self._video_rows.get(video_id)
+        if row is None:
+            return
+        self._set_video_item_state(row, "Selected" if video_id == self.current_video_id else "")
+
+    def _set_video_item_state(self, row: _VideoItemRow, state: str):
+        """アイテムの配色を切り替え（ttkウィジェットはスタイル名の変更のみ）"""
+        bg_color, accent_color = self._VIDEO_ITEM_COLORS[state]
+        row.accent.configure(bg=accent_color)
+        for widget, kind in row.styled_widgets:
+            widget.configure(style=f"VideoItem{state}.{kind}")
+        row.delete_btn.configure(bg=bg_color, activebackground=bg_color)
 
-    def _create_video_item(self, video: Video):
+    def _create_video_item(self, video: Video, before=None):
         """動画リストアイテムを作成 - Refined Editorial Style"""
-        font_family = self.i18n.get_font()
-        is_selected = video.id == self.current_video_id
-        bg_color = self.COLORS["selected"] if is_selected else self.COLORS["surface"]
+        state = "Selected" if video.id == self.current_video_id else ""
+        bg_color, accent_color = self._VIDEO_ITEM_COLORS[state]
+        colors = self.COLORS
+        frame_style = f"VideoItem{state}.TFrame"
 
         # 外枠 - 選択時は左ボーダーにアクセントカラー
-        outer_frame = tk.Frame(self.video_list_frame, bg=self.COLORS["surface"])
-        outer_frame.pack(fill=tk.X, padx=6, pady=3)
+        outer_frame = tk.Frame(self.video_list_frame, bg=colors["surface"],
+                               name=f"{self._VIDEO_ITEM_PREFIX}{video.id}")
+        if before is not None:
+            outer_frame.pack(fill=tk.X, padx=6, pady=3, before=before)
+        else:
+            outer_frame.pack(fill=tk.X, padx=6, pady=3)
 
         # 左アクセントバー（選択インジケーター）
-        accent_indicator = tk.Frame(outer_frame,
-                                     bg=self.COLORS["accent"] if is_selected else self.COLORS["surface"],
-                                     width=4)
+        accent_indicator = tk.Frame(outer_frame, bg=accent_color, width=4)
         accent_indicator.pack(side=tk.LEFT, fill=tk.Y)
 
-        item_frame = tk.Frame(outer_frame, bg=bg_color, cursor="hand2")
+        item_frame = ttk.Frame(outer_frame, style=frame_style, cursor="hand2")
         item_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # 削除ボタン（先にpackしてスペースを確保）
         delete_btn = tk.Button(item_frame, text="×",
-                                font=(font_family, 11),
-                                bg=bg_color, fg=self.COLORS["text_muted"],
+                                font=self.list_fonts["delete"],
+                                bg=bg_color, fg=colors["text_muted"],
                                 relief=tk.FLAT, cursor="hand2",
                                 activebackground=bg_color,
-                                activeforeground=self.COLORS["error"],
-                                command=lambda v=video: self._delete_video(v))
+                                activeforeground=colors["error"],
+                                command=f"{self._delete_video_cmd} {video.id}")
         delete_btn.pack(side=tk.RIGHT, padx=(0, 6), pady=8)
 
         # サムネイルコンテナ - より大きく
-        thumb_container = tk.Frame(item_frame, bg=bg_color)
+        thumb_container = ttk.Frame(item_frame, style=frame_style)
         thumb_container.pack(side=tk.LEFT, padx=10, pady=10)
 
-        thumb_label = tk.Label(thumb_container, bg=self.COLORS["border"])
+        thumb_label = tk.Label(thumb_container, bg=colors["border"])
         thumb_label.pack()
-        self._load_thumbnail(video.id, video.thumbnail, thumb_label)
 
         # 情報エリア
-        info_frame = tk.Frame(item_frame, bg=bg_color)
+        info_frame = ttk.Frame(item_frame, style=frame_style)
         info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=10, padx=(0, 4))
 
         # タイトル（省略）
-        title = video.title[:26] + "..." if len(video.title) > 26 else video.title
-        title_label = tk.Label(info_frame, text=title,
-                                font=(font_family, 10),
-                                bg=bg_color, fg=self.COLORS["text"],
-                                anchor=tk.W, wraplength=130, justify=tk.LEFT)
+        title_label = ttk.Label(info_frame, text=self._video_item_title(video),
+                                 font=self.list_fonts["title"], style=f"VideoItem{state}.TLabel",
+                                 anchor=tk.W, wraplength=130, justify=tk.LEFT)
         title_label.pack(fill=tk.X, anchor=tk.W)
 
-        # 要約済みマーク - より洗練されたバッジスタイル
-        if self.summary_store.get(video.id):
-            status_frame = tk.Frame(info_frame, bg=bg_color)
-            status_frame.pack(fill=tk.X, pady=(6, 0))
-
-            badge = tk.Label(status_frame, text=f"✓ {self.i18n.t('ui.summary_panel.summarized')}",
-                              fg=self.COLORS["success"],
-                              bg=self.COLORS["success_light"],
-                              font=(self.i18n.get_font(), 8, "bold"),
-                              padx=6, pady=1)
-            badge.pack(side=tk.LEFT)
-
-        # ホバー効果 - 左アクセントバーを含む
-        def on_enter(e):
-            if not is_selected:
-                accent_indicator.configure(bg=self.COLORS["accent"])
-                item_frame.configure(bg=self.COLORS["hover"])
-                for widget in [info_frame, title_label, thumb_container, delete_btn]:
-                    widget.configure(bg=self.COLORS["hover"])
-                if self.summary_store.get(video.id):
-                    status_frame.configure(bg=self.COLORS["hover"])
-
-        def on_leave(e):
-            if not is_selected:
-                accent_indicator.configure(bg=self.COLORS["surface"])
-                item_frame.configure(bg=self.COLORS["surface"])
-                for widget in [info_frame, title_label, thumb_container, delete_btn]:
-                    widget.configure(bg=self.COLORS["surface"])
-                if self.summary_store.get(video.id):
-                    status_frame.configure(bg=self.COLORS["surface"])
-
-        # クリックイベント
+        # クリック・ホバー - 左アクセントバーを含む
+        # サムネイルコンテナはラベルに覆われて見えないため配色を切り替えない
+        styled_widgets = [(item_frame, "TFrame"), (info_frame, "TFrame"), (title_label, "TLabel")]
         clickable_widgets = [item_frame, info_frame, title_label, thumb_label, thumb_container, accent_indicator]
-        if self.summary_store.get(video.id):
-            clickable_widgets.append(status_frame)
-
         for widget in clickable_widgets:
-            widget.bind("<Button-1>", lambda e, v=video: self._select_video(v))
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
-
-    def _load_thumbnail(self, video_id: str, url: str, label: tk.Label):
-        """サムネイルを非同期で読み込み - より大きいサイズ"""
-        def load():
-            try:
-                if video_id in self.thumbnail_cache:
-                    img = self.thumbnail_cache[video_id]
-                else:
-                    response = requests.get(url, timeout=5)
-                    image = Image.open(BytesIO(response.content))
-                    # 16:9比率を維持しつつ大きく
-                    image = image.resize(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-                    img = ImageTk.PhotoImage(image)
-                    self.thumbnail_cache[video_id] = img
-
-                label.configure(image=img)
-                label.image = img
-            except Exception as e:
-                print(f"[WARN] Failed to load thumbnail for {video_id}: {e}")
+            self._bind_video_item_events(widget)
+
+        self._video_rows[video.id] = _VideoItemRow(
+            outer=outer_frame,
+            accent=accent_indicator,
+            delete_btn=delete_btn,
+            info_frame=info_frame,
+            title_label=title_label,
+            thumb_label=thumb_label,
+            thumb_url=get_small_thumbnail_url(video.id),
+            styled_widgets=styled_widgets,
+        )
+        if self.summary_store.exists(video.id):
+            self._add_video_item_badge(video.id)
+        # サムネイルは表示範囲に入ったものから読み込む
+        self._schedule_visible_thumbnails()
+
+    @staticmethod
+    def _video_item_title(video: Video) -> str:
+        """リスト表示用に省略したタイトル"""
+        return _shorten(video.title, 26)
+
+    @classmethod
+    def _bind_video_item_events(cls, widget):
+        """アイテム内のウィジェットに共通のバインドタグを追加（クリック・ホバーはクラスバインドで処理）"""
+        tags = widget.bindtags()
+        widget.bindtags((tags[0], cls._VIDEO_ITEM_TAG) + tags[1:])
+
+    def _video_item_id(self, widget) -> str | None:
+        """アイテム内のウィジェットから動画IDを取得（外枠のウィジェット名から逆引き）"""
+        prefix = f"{self.video_list_frame}.{self._VIDEO_ITEM_PREFIX}"
+        path = str(widget)
+        if not path.startswith(prefix):
+            return None
+        return path[len(prefix):].split(".", 1)[0]
+
+    def _add_video_item_badge(self, video_id: str):
+        """要約済みマークを追加 - より洗練されたバッジスタイル"""
+        row = self._video_rows[video_id]
+        status_frame = ttk.Frame(row.info_frame, style=row.info_frame["style"])
+        status_frame.pack(fill=tk.X, pady=(6, 0))
+
+        badge = tk.Label(status_frame, text=f"✓ {self.i18n.t('ui.summary_panel.summarized')}",
+                          fg=self.COLORS["success"],
+                          bg=self.COLORS["success_light"],
+                          font=self.list_fonts["badge"],
+                          padx=6, pady=1)
+        badge.pack(side=tk.LEFT)
+
+        self._bind_video_item_events(status_frame)
+        row.styled_widgets.append((status_frame, "TFrame"))
+        row.badge = badge
+
+    def _on_video_item_hover(self, hovering: bool, event):
+        """動画リストアイテムのホバー（選択中のアイテムは配色を変えない）"""
+        video_id = self._video_item_id(event.widget)
+        row = self._video_rows.get(video_id)
+        if row is None:
+            return
+        # 同じアイテム内の子ウィジェット間の移動で発生するLeave/Enterは無視する
+        if hovering:
+            if self._hovered_video_id == video_id:
+                return
+            self._hovered_video_id = video_id
+        else:
+            target = event.widget.winfo_containing(event.x_root, event.y_root)
+            if target is not None and self._video_item_id(target) == video_id:
+                return
+            if self._hovered_video_id == video_id:
+                self._hovered_video_id = None
+        if video_id == self.current_video_id:
+            return
+        self._set_video_item_state(row, "Hover" if hovering else "")
+
+    def _on_video_item_click(self, event):
+        """動画リストアイテムのクリック"""
+        video_id = self._video_item_id(event.widget)
+        video = self.video_store.get(video_id) if video_id else None
+        if video:
+            self._select_video(video)
+
+    def _on_video_item_delete(self, video_id: str):
+        """動画リストアイテムの削除ボタン"""
+        video = self.video_store.get(video_id)
+        if video:
+            self._delete_video(video)
+
+    def _schedule_visible_thumbnails(self):
+        """表示範囲のサムネイル読み込みをアイドル時に1回だけ実行するよう予約"""
+        if self._thumbnail_check_pending:
+            return
+        self._thumbnail_check_pending = True
+        self._safe_after_idle(self._load_visible_thumbnails)
+
+    def _load_visible_thumbnails(self):
+        """スクロール表示範囲（前後1画面分を含む）のアイテムのサムネイルを読み込む"""
+        self._thumbnail_check_pending = False
+        canvas = self.video_list_canvas
+        view_height = canvas.winfo_height()
+        top = canvas.canvasy(0) - view_height
+        bottom = canvas.canvasy(0) + view_height * 2
+
+        for video_id, row in self._video_rows.items():
+            if row.thumb_requested:
+                continue
+            outer = row.outer
+            y = outer.winfo_y()
+            if y + outer.winfo_height() >= top and y <= bottom:
+                row.thumb_requested = True
+                self._load_thumbnail(video_id, row.thumb_url)
+
+        # 初回は表示範囲の読み込みを予約した後に残りを先読み
+        if not self._thumbnails_prefetched:
+            self._thumbnails_prefetched = True
+            self._prefetch_thumbnails()
+
+    def _load_thumbnail(self, video_id: str, url: str):
+        """サムネイルを読み込み（通信と画像処理はワーカースレッドで実行）"""
+        if video_id in self.thumbnail_cache:
+            self._attach_thumbnail(video_id, None)
+            return
 
-        threading.Thread(target=load, daemon=True).start()
+        def attach(future: Future):
+            # 失敗時の警告は _submit_thumbnail 側で出力済み
+            if future.cancelled() or future.exception() is not None:
+                return
+            self._safe_after(0, partial(self._attach_thumbnail, video_id, future.result()))
+
+        self._submit_thumbnail(video_id, url).add_done_callback(attach)
+
+    def _prefetch_thumbnails(self):
+        """表示範囲外のサムネイルを並列に取得・縮小してキャッシュしておく（Tkの画像はスクロール時に生成）"""
+        for video_id, row in self._video_rows.items():
+            if not row.thumb_requested:
+                self._submit_thumbnail(video_id, row.thumb_url)
+
+    def _submit_thumbnail(self, video_id: str, url: str) -> Future:
+        """サムネイルの取得をワーカーに投入（取得中の動画は実行中のジョブを共有する）"""
+        future = self._thumb_jobs.get(video_id)
+        if future is not None:
+            return future
+
+        def done(future: Future):
+            # ワーカースレッドから呼ばれる（dictの単一操作はスレッド間で安全）
+            self._thumb_jobs.pop(video_id, None)
+            # 終了処理でセッションを閉じた後の失敗は報告しない
+            if future.cancelled() or self._is_closing:
+                return
+            error = future.exception()
+            if error is not None:
+                print(f"[WARN] Failed to load thumbnail for {video_id}: {error}")
+
+        future = self._thumb_pool.submit(thumbnail_cache.get_thumbnail, video_id, url)
+        self._thumb_jobs[video_id] = future
+        future.add_done_callback(done)
+        return future
+
+    def _attach_thumbnail(self, video_id: str, image):
+        """サムネイルを行に設定（Tkの画像はメインスレッドでのみ生成する）"""
+        img = self.thumbnail_cache.get(video_id)
+        if img is None:
+            img = ImageTk.PhotoImage(image)
+            self.thumbnail_cache[video_id] = img
+        row = self._video_rows.get(video_id)
+        if row is not None:
+            row.thumb_label.configure(image=img)
 
     def _add_video(self):
         """動画を追加"""
@@ -850,50 +1171,94 @@ class YTSummarizer:
             messagebox.showinfo(self.i18n.t("messages.info"), self.i18n.t("messages.already_added"))
             return
 
-        # タイトル取得（非同期）
-        def add():
+        # 即座に追加し、タイトルが未取得なら仮タイトルで表示して後から差し替える
+        cached_title = get_cached_video_title(video_id)
+        video = Video(
+            id=video_id,
+            url=url,
+            title=cached_title or default_video_title(video_id),
+            thumbnail=get_thumbnail_url(video_id),
+        )
+        self.video_store.add(video)
+        self.url_entry.delete(0, tk.END)
+        self._on_video_added(video)
+
+        if cached_title is None:
+            self._fetch_titles([video_id])
+
+    def _fetch_titles(self, video_ids: list[str]):
+        """タイトルをバックグラウンドで並列取得して反映（取得中の動画は重複して取得しない）"""
+        video_ids = [vid for vid in video_ids if vid not in self._fetching_titles]
+        if not video_ids:
+            return
+        self._fetching_titles.update(video_ids)
+
+        def fetch():
             try:
-                title = get_video_title(video_id)
-                video = Video(
-                    id=video_id,
-                    url=url,
-                    title=title,
-                    thumbnail=get_thumbnail_url(video_id),
-                )
-                self.video_store.add(video)
-
-                self._safe_after(0, lambda: self._on_video_added(video))
+                titles = get_video_titles(video_ids)
             except Exception as e:
-                self._safe_after(0, lambda: messagebox.showerror(self.i18n.t("messages.error"), str(e)))
-
-        self.url_entry.delete(0, tk.END)
-        threading.Thread(target=add, daemon=True).start()
+                print(f"[WARN] Failed to fetch video titles: {e}")
+                titles = {}
+            self._safe_after(0, lambda: self._on_titles_fetched(video_ids, titles))
+
+        self._run_in_background(fetch)
+
+    def _fetch_missing_titles(self):
+        """仮タイトルのままの動画のタイトルを一括取得"""
+        video_ids = [v.id for v in self.video_store.videos if v.title == default_video_title(v.id)]
+        if video_ids:
+            self._fetch_titles(video_ids)
+
+    def _on_titles_fetched(self, video_ids: list[str], titles: dict[str, str]):
+        """取得したタイトルを該当する行とパネルにのみ反映"""
+        self._fetching_titles.difference_update(video_ids)
+        for video_id, title in titles.items():
+            video = self.video_store.get(video_id)
+            if video is None or video.title == title:
+                continue
+            self.video_store.set_title(video_id, title)
+            self._update_video_item(video)
+            if video_id == self.current_video_id:
+                self.video_title_label.configure(text=title)
 
     def _on_video_added(self, video: Video):
         """動画追加完了"""
-        self._refresh_video_list()
+        self._insert_video_item(video)
+        # 上限超過でストアから外れた動画のアイテムを削除
+        stored_ids = {v.id for v in self.video_store.videos}
+        for video_id in [vid for vid in self._video_rows if vid not in stored_ids]:
+            self._remove_video_item(video_id)
+        self._update_video_count()
         self._select_video(video)
 
     def _delete_video(self, video: Video):
         """動画を削除"""
-        title_short = video.title[:30] + "..." if len(video.title) > 30 else video.title
+        title_short = _shorten(video.title, 30)
         confirm_msg = self.i18n.t("ui.video_item.delete_confirm", title=title_short)
         if messagebox.askyesno(self.i18n.t("messages.confirm"), confirm_msg):
             self.video_store.remove(video.id)
             self.summary_store.remove(video.id)
-            self.thumbnail_cache.pop(video.id, None)
+            self.transcript_cache.remove(video.id)
+            thumbnail_cache.evict(video.id)
 
             if self.current_video_id == video.id:
                 self.current_video_id = None
                 self._clear_panels()
 
-            self._refresh_video_list()
+            self._remove_video_item(video.id)
+            self._update_video_count()
 
     def _select_video(self, video: Video):
         """動画を選択"""
+        previous_id = self.current_video_id
         self.current_video_id = video.id
         self.video_store.move_to_top(video.id)
-        self._refresh_video_list()
+
+        # 選択が変わった2行の配色と並び順のみ更新
+        if previous_id and previous_id != video.id:
+            self._apply_video_item_style(previous_id)
+        self._apply_video_item_style(video.id)
+        self._move_video_item_to_top(video.id)
         self._update_panels(video)
 
         # 字幕がなければ取得
@@ -903,6 +1268,7 @@ class YTSummarizer:
     def _clear_panels(self):
         """パネルをクリア"""
         self.video_title_label.configure(text="")
+        self._reset_generate_btn()
         self._set_text_content(self.summary_text, self.i18n.t("ui.content.select_video"))
         self._set_text_content(self.transcript_text, self.i18n.t("ui.content.select_video"))
 
@@ -911,55 +1277,104 @@ class YTSummarizer:
         self.video_title_label.configure(text=video.title)
 
         # 要約
-        summary = self.summary_store.get(video.id)
+        self._update_generate_btn(video.id)
+        self._update_summary_display(video, self.summary_store.get(video.id))
+
+        # 字幕
+        self._update_transcript_display(video)
+
+    def _update_summary_display(self, video: Video, summary: str | None):
+        """要約表示を更新"""
         if summary:
             self._render_markdown(self.summary_text, summary)
+        elif video.id in self._generating_summaries:
+            self._set_text_content(self.summary_text, self.i18n.t("ui.summary_panel.generating_summary"))
         elif video.transcript:
             self._set_text_content(self.summary_text, self.i18n.t("ui.summary_panel.prompt_generate"))
         else:
             self._set_text_content(self.summary_text, self.i18n.t("ui.transcript_panel.fetching"))
 
-        # 字幕
-        self._update_transcript_display(video)
-
     def _update_transcript_display(self, video: Video):
         """字幕表示を更新"""
-        self.transcript_text.configure(state=tk.NORMAL)
-        self.transcript_text.delete("1.0", tk.END)
-
-        if video.transcript:
-            for entry in video.transcript:
-                time_str = format_time(entry.start)
-                # 字幕テキスト内の改行を削除して1行にする
-                clean_text = entry.text.replace("\n", " ").strip()
-                self.transcript_text.insert(tk.END, f"{time_str} ", "timestamp")
-                self.transcript_text.insert(tk.END, f"{clean_text}\n")
-        else:
-            self.transcript_text.insert("1.0", self.i18n.t("ui.transcript_panel.fetching"))
+        if not video.transcript:
+            self._set_text_content(self.transcript_text, self.i18n.t("ui.transcript_panel.fetching"))
+            return
+        # 同じ字幕を表示中なら再構築しない（同じ動画の再選択・言語変更時など）
+        widget_key = str(self.transcript_text)
+        if self._rendered_sources.get(widget_key) is video.transcript:
+            return
+
+        # テキストとタグを交互に並べ、1回のinsert呼び出しでまとめて挿入
+        chunks = []
+        for entry in video.transcript:
+            # 字幕テキスト内の改行を削除して1行にする
+            clean_text = entry.text.replace("\n", " ").strip()
+            chunks.extend((f"{entry.start_text} ", "timestamp", f"{clean_text}\n", ""))
 
-        self.transcript_text.configure(state=tk.DISABLED)
+        self.transcript_text.configure(state=tk.NORMAL)
+        try:
+            self.transcript_text.delete("1.0", tk.END)
+            self.transcript_text.insert(tk.END, *chunks)
+        finally:
+            self.transcript_text.configure(state=tk.DISABLED)
+        self._rendered_sources[widget_key] = video.transcript
 
     def _fetch_transcript(self, video: Video):
         """字幕を取得"""
+        if video.id in self._fetching_transcripts:
+            return
+        self._fetching_transcripts.add(video.id)
+
         def fetch():
             try:
                 transcript = get_transcript(video.id)
-                self.video_store.set_transcript(video.id, transcript)
-
-                self._safe_after(0, lambda: self._on_transcript_fetched(video))
             except Exception as e:
-                self._safe_after(0, lambda: self._on_transcript_error(str(e)))
+                self._safe_after(0, lambda: self._on_transcript_error(video, str(e)))
+                return
 
-        threading.Thread(target=fetch, daemon=True).start()
+            # 取得中に削除された動画はキャッシュしない（保存の失敗は取得エラーとして扱わない）
+            if self.video_store.get(video.id) is not None:
+                try:
+                    self.transcript_cache.set(video.id, transcript)
+                except (OSError, ValueError, TypeError) as e:
+                    print(f"[WARN] Failed to save transcript cache: {e}")
+            stored = self.video_store.set_transcript(video.id, transcript)
+
+            self._safe_after(0, lambda: self._on_transcript_fetched(video.id, stored))
+
+        def load_cached():
+            # ディスクキャッシュにあれば通信枠を待たずに表示する（なければ通信して取得）
+            transcript = self.transcript_cache.get(video.id)
+            if transcript is None:
+                self._run_in_background(fetch)
+                return
+            stored = self.video_store.set_transcript(video.id, transcript)
+            self._safe_after(0, lambda: self._on_transcript_fetched(video.id, stored))
 
-    def _on_transcript_fetched(self, video: Video):
-        """字幕取得完了"""
-        video = self.video_store.get(video.id)
-        if video and video.id == self.current_video_id:
-            self._update_panels(video)
+        # 一括取得でスレッドが動画数分立たないよう、キャッシュ読み込み専用のプールで読み込む
+        self._cache_pool.submit(load_cached)
 
-    def _on_transcript_error(self, error: str):
+    def _fetch_all_transcripts(self):
+        """字幕未取得の動画をまとめて並列取得"""
+        for video in self.video_store.videos:
+            if not self.video_store.get_transcript(video.id):
+                self._fetch_transcript(video)
+
+    def _on_transcript_fetched(self, video_id: str, video: Video | None):
+        """字幕取得完了（videoは字幕を設定したストア上の動画。取得中に削除された場合はNone）"""
+        self._fetching_transcripts.discard(video_id)
+        if video is not None and video.id == self.current_video_id:
+            # 字幕パネルと、要約が未生成なら案内文のみ更新（要約の中身は読まない）
+            self._update_transcript_display(video)
+            if not self.summary_store.exists(video.id):
+                self._update_summary_display(video, None)
+
+    def _on_transcript_error(self, video: Video, error: str):
         """字幕取得エラー"""
+        self._fetching_transcripts.discard(video.id)
+        if video.id != self.current_video_id:
+            return
+
         # エラーメッセージを翻訳
         if error.startswith("TRANSCRIPT_FAILED:"):
             detail = error.replace("TRANSCRIPT_FAILED:", "").strip()
@@ -984,32 +1399,77 @@ class YTSummarizer:
             messagebox.showwarning(self.i18n.t("messages.warning"), self.i18n.t("messages.set_api_key_first"))
             return
 
+        if video.id in self._generating_summaries:
+            return
+        self._start_summary(video)
         # 生成中表示
-        self.generate_btn.configure(state=tk.DISABLED, text=f"⏳ {self.i18n.t('ui.summary_panel.generating')}",
-                                     bg=self.COLORS["text_muted"])
+        self._update_generate_btn(video.id)
         self._set_text_content(self.summary_text, self.i18n.t("ui.summary_panel.generating_summary"))
 
+    def _generate_all_summaries(self):
+        """字幕取得済みで要約のない動画をまとめて並列生成（同時実行数はネットワーク枠で制限）"""
+        if not get_api_key():
+            messagebox.showwarning(self.i18n.t("messages.warning"), self.i18n.t("messages.set_api_key_first"))
+            return
+        for video in self.video_store.videos:
+            if (video.transcript and video.id not in self._generating_summaries
+                    and not self.summary_store.exists(video.id)):
+                self._start_summary(video)
+                if video.id == self.current_video_id:
+                    self._update_generate_btn(video.id)
+                    self._set_text_content(self.summary_text, self.i18n.t("ui.summary_panel.generating_summary"))
+
+    def _start_summary(self, video: Video):
+        """要約をバックグラウンドで生成"""
+        self._generating_summaries.add(video.id)
+
         def generate():
             try:
-                transcript_text = " ".join([t.text for t in video.transcript])
+                transcript_text = video.full_text
                 prompt_template = self.i18n.t("prompts.summarize")
-                summary = summarize_transcript(transcript_text, prompt_template)
+                chunks = []
+                last_update = 0.0
+                for chunk in summarize_transcript_stream(transcript_text, prompt_template):
+                    chunks.append(chunk)
+                    # 途中経過の再描画は一定間隔に間引く
+                    now = time.monotonic()
+                    if now - last_update >= SUMMARY_STREAM_INTERVAL:
+                        last_update = now
+                        progress = "".join(chunks)
+                        self._safe_after(0, lambda text=progress: self._on_summary_progress(video, text))
+                summary = "".join(chunks)
+                if not summary:
+                    raise Exception("Empty response")
                 self.summary_store.set(video.id, summary)
+                # マークダウンの解析はこのスレッドで済ませておく（UIスレッドでは挿入のみ）
+                self._parse_markdown(summary)
 
-                self._safe_after(0, lambda: self._on_summary_generated(video))
+                self._safe_after(0, lambda: self._on_summary_generated(video, summary))
             except Exception as e:
-                self._safe_after(0, lambda: self._on_summary_error(str(e)))
-
-        threading.Thread(target=generate, daemon=True).start()
-
-    def _on_summary_generated(self, video: Video):
-        """要約生成完了"""
-        self._reset_generate_btn()
-        self._update_panels(video)
-        self._refresh_video_list()
-
-    def _on_summary_error(self, error: str):
-        """要約生成エラー"""
+                self._safe_after(0, lambda: self._on_summary_error(video, str(e)))
+
+        self._run_in_background(generate)
+
+    def _on_summary_progress(self, video: Video, text: str):
+        """要約生成途中のテキストを表示"""
+        if video.id == self.current_video_id:
+            self._set_text_content(self.summary_text, text)
+
+    def _on_summary_generated(self, video: Video, summary: str):
+        """要約生成完了（生成結果をそのまま表示し、保存先を読み直さない）"""
+        self._generating_summaries.discard(video.id)
+        if video.id == self.current_video_id:
+            self._reset_generate_btn()
+            self._update_summary_display(video, summary)
+        # 要約済みバッジを表示するため該当アイテムのみ更新
+        self._update_video_item(video)
+
+    def _on_summary_error(self, video: Video, error: str):
+        """要約生成エラー（表示中の動画のみパネルに表示）"""
+        self._generating_summaries.discard(video.id)
+        if video.id != self.current_video_id:
+            print(f"[WARN] Failed to generate summary for {video.id}: {error}")
+            return
         self._reset_generate_btn()
 
         # エラーメッセージを翻訳
@@ -1029,7 +1489,7 @@ class YTSummarizer:
         """設定ダイアログ - Refined Editorial Style with i18n"""
         dialog = tk.Toplevel(self.root)
         dialog.title(self.i18n.t("ui.settings_dialog.title"))
-        dialog.geometry("480x400")
+        dialog.geometry("480x440")
         dialog.resizable(False, False)
         dialog.transient(self.root)
         dialog.grab_set()
@@ -1042,7 +1502,7 @@ class YTSummarizer:
 
         tk.Label(header, text=f"⚙ {self.i18n.t('ui.settings_dialog.title')}",
                  bg=self.COLORS["primary"], fg=self.COLORS["text_inverse"],
-                 font=(self.i18n.get_font(), 13, "bold")).pack(side=tk.LEFT, padx=20, pady=10)
+                 font=(self.font_family, 13, "bold")).pack(side=tk.LEFT, padx=20, pady=10)
 
         # コンテンツ
         content = tk.Frame(dialog, bg=self.COLORS["surface"])
@@ -1052,7 +1512,7 @@ class YTSummarizer:
         tk.Label(content, text=self.i18n.t("ui.settings_dialog.language"),
                  bg=self.COLORS["surface"],
                  fg=self.COLORS["text"],
-                 font=(self.i18n.get_font(), 11, "bold")).pack(anchor=tk.W)
+                 font=(self.font_family, 11, "bold")).pack(anchor=tk.W)
 
         lang_container = tk.Frame(content, bg=self.COLORS["border"])
         lang_container.pack(fill=tk.X, pady=(10, 16))
@@ -1072,14 +1532,14 @@ class YTSummarizer:
 
         lang_var = tk.StringVar(value=lang_options[current_idx])
         lang_menu = tk.OptionMenu(lang_inner, lang_var, *lang_options)
-        lang_menu.configure(font=(self.i18n.get_font(), 11),
+        lang_menu.configure(font=(self.font_family, 11),
                            bg=self.COLORS["surface_alt"],
                            fg=self.COLORS["text"],
                            relief=tk.FLAT,
                            highlightthickness=0,
                            activebackground=self.COLORS["accent"],
                            activeforeground=self.COLORS["text_inverse"])
-        lang_menu["menu"].configure(font=(self.i18n.get_font(), 10),
+        lang_menu["menu"].configure(font=(self.font_family, 10),
                                     bg=self.COLORS["surface_alt"],
                                     fg=self.COLORS["text"])
         lang_menu.pack(fill=tk.X, padx=10, pady=8)
@@ -1088,11 +1548,11 @@ class YTSummarizer:
         tk.Label(content, text=self.i18n.t("ui.settings_dialog.api_key_label"),
                  bg=self.COLORS["surface"],
                  fg=self.COLORS["text"],
-                 font=(self.i18n.get_font(), 11, "bold")).pack(anchor=tk.W)
+                 font=(self.font_family, 11, "bold")).pack(anchor=tk.W)
 
         # 入力フィールドコンテナ
         _, api_entry = self._create_bordered_entry(
-            content, font=(self.i18n.get_font(), 11), show="•",
+            content, font=(self.font_family, 11), show="•",
             pack_kwargs={"fill": tk.X, "pady": (10, 0)}
         )
         api_entry.insert(0, get_api_key() or "")
@@ -1100,11 +1560,24 @@ class YTSummarizer:
         # リンク
         link = tk.Label(content, text=f"→ {self.i18n.t('ui.settings_dialog.api_key_link')}",
                         fg=self.COLORS["accent"], bg=self.COLORS["surface"],
-                        cursor="hand2", font=(self.i18n.get_font(), 10))
+                        cursor="hand2", font=(self.font_family, 10))
         link.pack(anchor=tk.W, pady=(10, 0))
         link.bind("<Button-1>", lambda e: webbrowser.open("https://aistudio.google.com/app/apikey"))
         self._bind_hover(link, self.COLORS["accent_hover"], self.COLORS["accent"], config_key="fg")
 
+        # 字幕キャッシュ削除
+        def clear_transcript_cache(e):
+            self.transcript_cache.clear()
+            messagebox.showinfo(self.i18n.t("messages.info"),
+                                self.i18n.t("messages.transcript_cache_cleared"), parent=dialog)
+
+        clear_cache_link = tk.Label(content, text=f"🗑 {self.i18n.t('ui.settings_dialog.clear_transcript_cache')}",
+                                    fg=self.COLORS["text_secondary"], bg=self.COLORS["surface"],
+                                    cursor="hand2", font=(self.font_family, 10))
+        clear_cache_link.pack(anchor=tk.W, pady=(10, 0))
+        clear_cache_link.bind("<Button-1>", clear_transcript_cache)
+        self._bind_hover(clear_cache_link, self.COLORS["error"], self.COLORS["text_secondary"], config_key="fg")
+
         # ボタン
         btn_frame = tk.Frame(dialog, bg=self.COLORS["surface"])
         btn_frame.pack(pady=(0, 20))
@@ -1130,13 +1603,12 @@ class YTSummarizer:
             # ダイアログを閉じる
             dialog.destroy()
 
-            # 言語変更を適用
+            # 言語変更を適用（オブザーバー経由で _on_language_changed が呼ばれる）
             if language_changed:
-                self.i18n.current_language = selected_lang_code
-                self._on_language_changed()
+                self.i18n.set_language(selected_lang_code)
 
         cancel_btn = tk.Button(btn_frame, text=self.i18n.t("ui.settings_dialog.cancel"),
-                                font=(self.i18n.get_font(), 10),
+                                font=(self.font_family, 10),
                                 bg=self.COLORS["surface_alt"],
                                 fg=self.COLORS["text"],
                                 relief=tk.FLAT,
@@ -1146,7 +1618,7 @@ class YTSummarizer:
         cancel_btn.pack(side=tk.LEFT, padx=8)
 
         save_btn = tk.Button(btn_frame, text=self.i18n.t("ui.settings_dialog.save_and_close"),
-                              font=(self.i18n.get_font(), 10, "bold"),
+                              font=(self.font_family, 10, "bold"),
                               bg=self.COLORS["accent"],
                               fg=self.COLORS["text_inverse"],
                               relief=tk.FLAT,
@@ -1161,7 +1633,11 @@ class YTSummarizer:
 
     def _on_language_changed(self):
         """言語変更時にUI全体を更新"""
-        font_family = self.i18n.get_font()
+        if self.i18n.current_language == self._applied_language:
+            return
+        self._applied_language = self.i18n.current_language
+        font_changed = self.i18n.get_font() != self.font_family
+        self.font_family = font_family = self.i18n.get_font()
 
         # ウィンドウタイトル
         self.root.title(self.i18n.t("ui.app_title"))
@@ -1200,12 +1676,23 @@ class YTSummarizer:
             font=(font_family, 13, "bold")
         )
 
+        # 一括取得ボタン
+        self.fetch_all_btn.configure(
+            text=f"⬇ {self.i18n.t('ui.transcript_panel.fetch_all')}",
+            font=(font_family, 10)
+        )
+
         # 生成ボタン
         self.generate_btn.configure(
             text=f"✨ {self.i18n.t('ui.summary_panel.generate')}",
             font=(font_family, 10, "bold")
         )
 
+        self.generate_all_btn.configure(
+            text=f"✨ {self.i18n.t('ui.summary_panel.generate_all')}",
+            font=(font_family, 10)
+        )
+
         # YouTubeリンク
         self.youtube_link.configure(
             text=f"▶ {self.i18n.t('ui.content.watch_on_youtube')}",
@@ -1218,19 +1705,18 @@ class YTSummarizer:
             font=(font_family, 9)
         )
 
-        # テキストエリアのフォント更新
-        size = self._get_font_size()
-        self.summary_text.configure(font=(font_family, size))
-        self.transcript_text.configure(font=(font_family, size))
-        self.transcript_text.tag_configure("timestamp",
-                                            font=(font_family, size, "bold"),
-                                            foreground=self.COLORS["accent"])
-
-        # マークダウンタグを再設定
-        self._configure_markdown_tags(self.summary_text)
+        # テキストエリア・マークダウンタグ・動画リストのフォント更新（フォントが変わった場合のみ）
+        # 動画リストは共有フォントを変更するだけで全アイテムに反映される
+        if font_changed:
+            self._apply_text_fonts()
+            for list_font in self.list_fonts.values():
+                list_font.configure(family=font_family)
 
-        # 動画リストを再描画（フォント更新含む）
-        self._refresh_video_list()
+        # 動画リストのバッジの文言を更新
+        summarized_text = f"✓ {self.i18n.t('ui.summary_panel.summarized')}"
+        for row in self._video_rows.values():
+            if row.badge is not None:
+                row.badge.configure(text=summarized_text)
 
         # パネルコンテンツを更新
         if self.current_video_id:
@@ -1240,12 +1726,20 @@ class YTSummarizer:
         else:
             self._clear_panels()
 
-        # UIの強制更新
-        self.root.update_idletasks()
-
     def _on_close(self):
         """アプリ終了"""
         self._is_closing = True
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        self._cache_pool.shutdown(wait=False, cancel_futures=True)
+        self._network_pool.shutdown(wait=False, cancel_futures=True)
+        # 保存待ちのフォントサイズを確定
+        if self._font_scale_save_id is not None:
+            self.root.after_cancel(self._font_scale_save_id)
+            self._save_font_scale()
+        # 遅延中の動画リスト保存を確定
+        self.video_store.flush()
+        flush_title_cache()
+        close_session()
         self.root.destroy()
 
 